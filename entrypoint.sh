@@ -5,12 +5,31 @@ until PGPASSWORD=q1w2e3 psql -h db -U postgres -p 5432 -d posts_db  -c '\q'; do
   sleep 1
 done
 
->&2 echo "PostgreSQL готов - выполняем миграции"
+>&2 echo "PostgreSQL готов"
+
+# Миграции и обслуживание выполняет только веб-контейнер. gRPC-сервер (SERVICE_ROLE=grpc)
+# масштабируется отдельно: повторный reset-image-processing пометил бы как failed посты,
+# изображения которых ещё обрабатывают веб-воркеры, а миграции шли бы параллельно.
+if [ "${SERVICE_ROLE:-web}" != "web" ]; then
+  exec "$@"
+fi
+
+>&2 echo "Выполняем миграции"
 
 flask db init || true
 
+flask posts dedupe-actions || true
+
 flask db migrate -m "Auto migration"
 
 flask db upgrade
 
+flask posts reindex-search --missing-only
+
+flask posts backfill-history
+
+flask posts reconcile-counters
+
+flask posts reset-image-processing
+
 exec "$@"
\ No newline at end of file
@@ -0,0 +1,44 @@
+import multiprocessing
+import os
+
+# Продакшен-запуск HTTP API: gunicorn -c gunicorn.conf.py app:app
+# gRPC-сервер запускается отдельным процессом: python -m src.grpc_server.post_server
+
+bind = os.getenv('WEB_BIND', '0.0.0.0:5000')
+workers = int(os.getenv('WEB_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv('WEB_THREADS', 4))
+worker_class = 'gthread'
+timeout = int(os.getenv('WEB_TIMEOUT', 60))
+# Сколько секунд после SIGTERM воркер дообрабатывает уже принятые запросы.
+graceful_timeout = int(os.getenv('WEB_GRACEFUL_TIMEOUT', 30))
+keepalive = 5
+accesslog = '-'
+errorlog = '-'
+
+# Приложение загружается в каждом воркере после fork: gRPC-каналы и пулы соединений
+# с базой нельзя разделять между процессами.
+preload_app = False
+
+# Пул обработки изображений (IMAGE_WORKERS) создаётся в каждом воркере, а сама обработка
+# упирается в CPU: бюджет процессов задаётся на хост и делится между воркерами, но каждому
+# достаётся хотя бы один процесс. Всего на хосте max(workers, IMAGE_HOST_WORKERS) процессов
+# обработки; каждый импортирует приложение, cv2 и grpc, поэтому при большом WEB_WORKERS
+# выгоднее уменьшить число воркеров и поднять WEB_THREADS.
+image_host_workers = int(os.getenv('IMAGE_HOST_WORKERS', multiprocessing.cpu_count()))
+image_workers_per_worker = max(1, image_host_workers // workers)
+
+
+def post_worker_init(worker):
+    from src.services.image_processor import image_processor
+
+    image_processor.max_workers = image_workers_per_worker
+
+
+def worker_exit(server, worker):
+    # Дописываем отложенные просмотры и дожидаемся обработки изображений перед выходом воркера.
+    from src.services.view_recorder import view_recorder
+    from src.services.image_processor import image_processor
+
+    if view_recorder.app is not None:
+        view_recorder.flush()
+    image_processor.shutdown()
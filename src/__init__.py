@@ -6,6 +6,9 @@ from .db import db
 
 from .blueprints import api_bp
 from .config import Config
+from .services.view_recorder import view_recorder
+from .services.image_processor import image_processor
+from .services.post_service import suggestion_index
 
 migrate = Migrate()
 
@@ -18,11 +21,17 @@ def create_app():
 
     db.init_app(app)
     migrate.init_app(app, db)
+    view_recorder.init_app(app)
+    image_processor.init_app(app)
+    suggestion_index.init_app(app)
     CORS(app, resources={r"/*": {"origins": ["http://localhost:5173", "http://localhost:5001", "http://localhost:5002", "http://127.0.0.1:5000", "http://127.0.0.1", "http://158.160.144.253"]}}, supports_credentials=True )
 
 
     from .blueprints import api_bp
     app.register_blueprint(api_bp, url_prefix='/api')
 
+    from .commands import posts_cli
+    app.cli.add_command(posts_cli)
+
 
     return app
\ No newline at end of file
@@ -1,11 +1,85 @@
-from flask import Blueprint, current_app, send_from_directory
+import mimetypes
+import os
+
+from flask import Blueprint, current_app, request
+from werkzeug.exceptions import NotFound
+
+from ..utils.post_utils import parse_variant_path, variant_path
+from ..utils.storage import asset_storage
 
 file_bp = Blueprint('file', __name__)
 
+IMAGE_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
+
+
+def _accepts_webp():
+    # Явная проверка: */* от curl и старых клиентов не должен означать поддержку WebP.
+    return any(value == 'image/webp' and quality > 0 for value, quality in request.accept_mimetypes)
+
+
+def _choose_variant(filename, width, accept_webp):
+    stem, path_width, extension = parse_variant_path(filename)
+    if extension.lower() not in IMAGE_EXTENSIONS:
+        return filename
+
+    width = width or path_width
+    widths = sorted(w for w in current_app.config.get('IMAGE_VARIANT_WIDTHS', ()) if w >= width) if width else []
+    extensions = ['webp', extension] if accept_webp and extension != 'webp' else [extension]
+    original = f'{stem}.{extension}'
+
+    # Самый узкий вариант не меньше запрошенной ширины; если его нет (исходник был меньше
+    # или изображение загружено до появления вариантов) — следующий, в конце — сам файл.
+    for candidate_width in widths + [None]:
+        for candidate_extension in extensions:
+            candidate = variant_path(original, candidate_width, candidate_extension)
+            if asset_storage.exists(candidate):
+                return candidate
+    return filename
+
+
+def _accel_redirect(path, etag):
+    # Байты отдаёт nginx из internal-location, Flask только проверяет условия запроса.
+    local_path = asset_storage.local_path(path)
+    if not local_path or not os.path.isfile(local_path):
+        raise NotFound()
+
+    stat = os.stat(local_path)
+    response = current_app.response_class(mimetype=mimetypes.guess_type(local_path)[0] or 'application/octet-stream')
+    response.headers['X-Accel-Redirect'] = current_app.config['FILE_ACCEL_REDIRECT_PREFIX'] + \
+        asset_storage.relative_path(path)
+    response.last_modified = stat.st_mtime
+    response.set_etag(etag or f'{stat.st_mtime}-{stat.st_size}')
+    return response.make_conditional(request)
+
+
+def _send_asset(path):
+    # Файл по контентному адресу не меняется никогда: ETag — его имя (одинаковое на всех серверах),
+    # кэшировать можно навсегда. Старые пути кэшируются на FILE_CACHE_MAX_AGE с валидацией.
+    immutable = asset_storage.is_content_addressed(path)
+    etag = os.path.basename(path) if immutable else None
+    max_age = current_app.config['IMMUTABLE_FILE_MAX_AGE'] if immutable else current_app.config['FILE_CACHE_MAX_AGE']
+
+    if current_app.config.get('FILE_ACCEL_REDIRECT_PREFIX'):
+        response = _accel_redirect(path, etag)
+    else:
+        # conditional=True: 304 по If-None-Match/If-Modified-Since и 206 по Range;
+        # при USE_X_SENDFILE Flask сам заменяет тело заголовком X-Sendfile.
+        response = asset_storage.send(path, conditional=True, etag=etag if etag else True, max_age=max_age)
+
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    response.cache_control.immutable = immutable
+    return response
+
+
 @file_bp.route('/<path:filename>')
 def serve_image(filename):
+    if asset_storage.is_private(filename):
+        return 'Файл не найден', 404
     try:
-        clean_filename = filename.replace('src/assets/', '')
-        return send_from_directory(current_app.config['UPLOAD_FOLDER'], clean_filename)
+        clean_filename = _choose_variant(filename, request.args.get('w', type=int), _accepts_webp())
+        response = _send_asset(clean_filename)
+        response.vary.add('Accept')
+        return response
     except Exception as e:
         return 'Файл не найден', 404
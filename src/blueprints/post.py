@@ -10,8 +10,13 @@ from ..services.post_service import (
     search_posts_service,
     get_search_suggestions_service,
     get_user_posts_service,
-    add_like_to_post_service
+    add_like_to_post_service,
+    get_cache_stats_service,
+    upload_images_service
 )
+from ..services.view_recorder import view_recorder
+from ..services.image_processor import image_processor
+from ..config import Config
 
 post_bp = Blueprint('post', __name__)
 
@@ -29,6 +34,30 @@ def create_post():
         return jsonify({'error': str(e)}), 400
 
 
+@post_bp.route('/upload', methods=['POST'])
+@jwt_required(refresh=True)
+def upload_images():
+    current_user_email = get_jwt_identity()
+
+    try:
+        if request.mimetype.startswith('multipart/'):
+            files = [(file.stream, file.mimetype, file.filename) for file in request.files.getlist('file')]
+            if not files:
+                return jsonify({'error': 'Файлы не переданы'}), 400
+        else:
+            if request.content_length and request.content_length > Config.MAX_IMAGE_SIZE:
+                return jsonify({'error': 'Файл слишком большой'}), 413
+            files = [(request.stream, request.mimetype, None)]
+
+        assets = upload_images_service(files, current_user_email)
+        return jsonify({'assets': assets}), 201
+
+    except PermissionError as e:
+        return jsonify({'error': str(e)}), 401
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+
 @post_bp.route('/delete/<string:post_address>', methods=['DELETE'])
 @jwt_required(refresh=True)
 def delete_post(post_address):
@@ -69,10 +98,12 @@ def get_all_posts():
 
         current_user_email = get_jwt_identity()
 
-        posts = get_all_posts_service(date_filter_type, start_date, end_date, tags_filter, current_user_email)
-        print(posts)
+        posts = get_all_posts_service(date_filter_type, start_date, end_date, tags_filter, current_user_email,
+                                      cursor=filters.get('cursor'), limit=filters.get('limit'))
         return jsonify(posts), 200
 
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         print(f"Ошибка на сервере: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -94,9 +125,11 @@ def get_post_by_address(post_address):
 def add_like_to_post(post_address):
     finger_print = request.args.get("fingerprint")
     try:
-        add_like_to_post_service(post_address, finger_print)
-        return jsonify({'message': 'Действие выполнено успешно'}), 200
+        counters = add_like_to_post_service(post_address, finger_print)
+        return jsonify({'message': 'Действие выполнено успешно', **counters}), 200
 
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 404
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -113,8 +146,11 @@ def get_all_not_approved_posts():
         end_date = filters.get('endDate')
 
         current_user_email = get_jwt_identity()
-        posts = get_all_posts_service(date_filter_type=date_filter_type, start_date=start_date, end_date=end_date, tags_filter=tags_filter, current_user_email=None, only_not_approved=current_user_email)
+        posts = get_all_posts_service(date_filter_type=date_filter_type, start_date=start_date, end_date=end_date, tags_filter=tags_filter, current_user_email=None, only_not_approved=current_user_email,
+                                      cursor=filters.get('cursor'), limit=filters.get('limit'))
         return jsonify(posts), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         print(f"Ошибка на сервере: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -145,10 +181,14 @@ def search_posts():
             date_filter_type=data.get('dateFilterType'),
             tags_filter=data.get('tagsFilter', []),
             start_date=data.get('startDate'),
-            end_date=data.get('endDate')
+            end_date=data.get('endDate'),
+            cursor=data.get('cursor'),
+            limit=data.get('limit')
         )
 
         return jsonify(results), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -173,4 +213,13 @@ def get_user_posts():
         posts = get_user_posts_service(user_id)
         return posts
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
\ No newline at end of file
+        return jsonify({'error': str(e)}), 500
+
+
+@post_bp.route("/metrics", methods=['GET'])
+def get_metrics():
+    return jsonify({
+        'caches': get_cache_stats_service(),
+        'view_queue': view_recorder.stats(),
+        'image_queue': image_processor.stats()
+    }), 200
@@ -0,0 +1,56 @@
+import click
+from flask.cli import AppGroup
+
+from .services.post_service import backfill_history_dates_service, reindex_search_service, \
+    reconcile_post_counters_service, dedupe_user_actions_service, \
+    reset_image_processing_service
+from .utils.post_utils import build_missing_variants
+from .utils.storage import asset_storage
+from .config import Config
+
+posts_cli = AppGroup('posts', help='Обслуживание данных постов.')
+
+
+@posts_cli.command('backfill-history')
+@click.option('--batch-size', default=500, show_default=True)
+def backfill_history_command(batch_size):
+    """Заполняет history_start/history_end из JSON date_range."""
+    updated = backfill_history_dates_service(batch_size)
+    click.echo(f'Исторические даты заполнены для {updated} постов')
+
+
+@posts_cli.command('reindex-search')
+@click.option('--batch-size', default=500, show_default=True)
+@click.option('--missing-only', is_flag=True, help='Только посты, которых ещё нет в индексе.')
+def reindex_search_command(batch_size, missing_only):
+    """Перестраивает полнотекстовый индекс постов."""
+    indexed = reindex_search_service(batch_size, missing_only)
+    click.echo(f'В поисковый индекс добавлено {indexed} постов')
+
+
+@posts_cli.command('reconcile-counters')
+def reconcile_counters_command():
+    """Пересчитывает likes_count/views_count по таблице UserActions."""
+    updated = reconcile_post_counters_service()
+    click.echo(f'Счётчики исправлены у {updated} постов')
+
+
+@posts_cli.command('dedupe-actions')
+def dedupe_actions_command():
+    """Удаляет повторные UserActions для одной пары (post_id, finger_print)."""
+    removed = dedupe_user_actions_service()
+    click.echo(f'Удалено {removed} дублирующихся действий')
+
+
+@posts_cli.command('reset-image-processing')
+def reset_image_processing_command():
+    """Помечает посты с незавершённой обработкой изображений как failed."""
+    updated = reset_image_processing_service()
+    click.echo(f'Статус обработки сброшен у {updated} постов')
+
+
+@posts_cli.command('build-image-variants')
+def build_image_variants_command():
+    """Создаёт уменьшенные и WebP-варианты для ранее загруженных изображений."""
+    built = build_missing_variants(asset_storage, Config.IMAGE_VARIANT_WIDTHS)
+    click.echo(f'Варианты созданы для {built} изображений')
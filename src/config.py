@@ -13,3 +13,40 @@ class Config:
     ALLOWED_IMAGE_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif'}
     MAX_IMAGE_SIZE = 16 * 1024 * 1024
     UPLOAD_FOLDER = os.path.join(os.getcwd(), 'src', 'assets')
+    # Исходники загрузок (/post/upload) — вне UPLOAD_FOLDER, чтобы их нельзя было скачать.
+    UPLOAD_SOURCE_FOLDER = os.path.join(os.getcwd(), 'uploads')
+    USER_CACHE_TTL = 300
+    TAG_CACHE_TTL = 600
+    NEGATIVE_CACHE_TTL = 30
+    LOOKUP_CACHE_SIZE = 10000
+    POSTS_PAGE_SIZE = 20
+    POSTS_MAX_PAGE_SIZE = 100
+    SUGGEST_INDEX_TTL = 300
+    POST_CACHE_TTL = 300
+    POST_CACHE_SIZE = 2000
+    VIEW_FLUSH_INTERVAL = 2
+    VIEW_FLUSH_BATCH_SIZE = 500
+    VIEW_QUEUE_MAX = 10000
+    # Процессов обработки изображений на один процесс приложения; под gunicorn
+    # переопределяется из IMAGE_HOST_WORKERS (см. gunicorn.conf.py).
+    IMAGE_WORKERS = 2
+    IMAGE_VARIANT_WIDTHS = (320, 640, 1280, 1920)
+    FILE_CACHE_MAX_AGE = 24 * 60 * 60
+    IMMUTABLE_FILE_MAX_AGE = 365 * 24 * 60 * 60
+    USE_X_SENDFILE = False
+    # Префикс internal-location nginx (например '/protected-assets/'); None — отдавать файлы из Flask.
+    FILE_ACCEL_REDIRECT_PREFIX = None
+    GRPC_PORT = 50055
+    # Потоки для обработчиков, работающих с базой; не больше размера пула соединений.
+    GRPC_WORKERS = 10
+    GRPC_GRACE_PERIOD = 10
+    # Одновременно обслуживаемые вызовы; сверх лимита клиент получает RESOURCE_EXHAUSTED.
+    GRPC_MAX_CONCURRENT_RPCS = 1000
+    GRPC_MAX_BATCH_SIZE = 500
+    # Одновременные выгрузки ExportPosts; каждая держит свой поток и серверный курсор.
+    GRPC_MAX_EXPORTS = 4
+    GRPC_EXPORT_BATCH_SIZE = 500
+    GRPC_KEEPALIVE_TIME_MS = 30 * 1000
+    GRPC_KEEPALIVE_TIMEOUT_MS = 10 * 1000
+    # 'gzip', 'deflate' или None — сжатие ответов по умолчанию.
+    GRPC_COMPRESSION = 'gzip'
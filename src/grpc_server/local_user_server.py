@@ -0,0 +1,58 @@
+import json
+import sys
+
+import grpc
+from concurrent import futures
+from src.proto import user_pb2, user_pb2_grpc
+
+# Локальная замена user-api для разработки и тестов: отдаёт пользователей из памяти
+# на том же порту, что и настоящий сервис.
+
+
+class LocalUserService(user_pb2_grpc.gRPCUserServiceServicer):
+    def __init__(self, users):
+        self.users = {int(user['id']): user for user in users}
+
+    def _to_response(self, user, response_cls=user_pb2.GetUserByIdResponse):
+        return response_cls(
+            id=str(user['id']),
+            email=user.get('email', ''),
+            name=user.get('name', ''),
+            surname=user.get('surname', ''),
+            role=user.get('role', 'user')
+        )
+
+    def GetUserByEmail(self, request, context):
+        for user in self.users.values():
+            if user.get('email') == request.email:
+                return self._to_response(user, user_pb2.GetUserByEmailResponse)
+        context.abort(grpc.StatusCode.NOT_FOUND, 'User not found')
+
+    def GetUserById(self, request, context):
+        user = self.users.get(request.user_id)
+        if not user:
+            context.abort(grpc.StatusCode.NOT_FOUND, 'User not found')
+        return self._to_response(user)
+
+    def GetUsersByIds(self, request, context):
+        return user_pb2.GetUsersByIdsResponse(users=[
+            self._to_response(self.users[user_id])
+            for user_id in request.user_ids if user_id in self.users
+        ])
+
+
+def run_local_user_server(users, port=50053):
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    user_pb2_grpc.add_gRPCUserServiceServicer_to_server(LocalUserService(users), server)
+    server.add_insecure_port(f'127.0.0.1:{port}')
+    server.start()
+    return server
+
+
+if __name__ == '__main__':
+    # python -m src.grpc_server.local_user_server users.json
+    with open(sys.argv[1], encoding='utf-8') as f:
+        users = json.load(f)
+    server = run_local_user_server(users)
+    print("Local user gRPC Server started on port 50053")
+    server.wait_for_termination()
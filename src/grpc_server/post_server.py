@@ -1,21 +1,230 @@
-import grpc
+import asyncio
+import json
+import signal
 from concurrent import futures
+
+import grpc
 from src.proto import post_pb2, post_pb2_grpc
-from ..services.post_service import remove_tag_from_all_posts_service
+from ..services.post_service import (
+    remove_tag_from_all_posts_service, update_tag_name_service, invalidate_user_cache, get_posts_by_ids_service,
+    get_creator_post_summaries_service, count_posts_by_tag_service, iter_post_batches_for_export
+)
+
+_COMPRESSION = {
+    'gzip': grpc.Compression.Gzip,
+    'deflate': grpc.Compression.Deflate,
+    None: grpc.Compression.NoCompression
+}
+
+
+def _json(value):
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _created_at(post):
+    return post['created_at'].isoformat() if post['created_at'] else ''
+
+
+def _tags(post):
+    return [post_pb2.PostTag(tag_id=tag['tag_id'], tag_name=tag['tag_name'] or '') for tag in post['tags']]
+
+
+def _post_summary_message(post):
+    return post_pb2.PostSummary(
+        id=post['id'],
+        address=post['address'],
+        header=post['header'],
+        main_image=post['main_image'] or '',
+        lead=post['lead'] or '',
+        author=post['author'] or '',
+        is_approved=bool(post['is_approved']),
+        processing_status=post['processing_status'],
+        created_at=_created_at(post),
+        date_range=_json(post['date_range']),
+        tags=_tags(post)
+    )
+
+
+def _post_message(post):
+    return post_pb2.Post(
+        id=post['id'],
+        address=post['address'],
+        header=post['header'],
+        main_image=post['main_image'] or '',
+        lead=post['lead'] or '',
+        creator_id=post['creator_id'],
+        author=post['author'] or '',
+        reviewer=post['reviewer'] or '',
+        is_approved=bool(post['is_approved']),
+        processing_status=post['processing_status'],
+        created_at=_created_at(post),
+        date_range=_json(post['date_range']),
+        structure=_json(post['structure']),
+        tags=_tags(post),
+        texts=[text['text'] for text in post['text']],
+        images=[
+            post_pb2.PostImage(address=image['address'], description=image['description'] or '')
+            for image in post['images']
+        ],
+        videos=[video['address'] for video in post['videos']],
+        likes=post['likes'],
+        views=post['views']
+    )
+
 
 class gRPCPostService(post_pb2_grpc.gRPCPostServiceServicer):
-    def __init__(self, app):
+    """Асинхронный сервис постов.
+
+    Вызовы принимаются и мультиплексируются в цикле событий grpc.aio; код, работающий
+    с базой, выполняется в пуле из GRPC_WORKERS потоков, каждый вызов — в своём app context.
+    """
+
+    def __init__(self, app, executor):
         self.app = app
+        self.executor = executor
+        self.max_batch_size = app.config['GRPC_MAX_BATCH_SIZE']
+        self.export_batch_size = app.config['GRPC_EXPORT_BATCH_SIZE']
+        self._exports = asyncio.Semaphore(app.config['GRPC_MAX_EXPORTS'])
+
+    def _in_app_context(self, func, *args):
+        with self.app.app_context():
+            return func(*args)
+
+    async def _run(self, context, func, *args):
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.executor, self._in_app_context, func, *args)
+        except ValueError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+
+    async def _check_batch(self, context, ids):
+        if len(ids) > self.max_batch_size:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f'Слишком много идентификаторов: {len(ids)}, максимум {self.max_batch_size}'
+            )
+
+    async def RemoveTagFromPosts(self, request, context):
+        success = await self._run(context, remove_tag_from_all_posts_service, request.tag_id)
+        return post_pb2.RemoveTagResponse(success=success)
 
-    def RemoveTagFromPosts(self, request, context):
+    async def UpdateTagName(self, request, context):
+        updated = await self._run(context, update_tag_name_service, request.tag_id, request.tag_name)
+        return post_pb2.UpdateTagNameResponse(success=True, updated=updated)
+
+    async def InvalidateUser(self, request, context):
+        invalidate_user_cache(user_id=request.user_id, email=request.email)
+        return post_pb2.InvalidateUserResponse(success=True)
+
+    async def GetPostsByIds(self, request, context):
+        await self._check_batch(context, request.post_ids)
+        posts = await self._run(
+            context, get_posts_by_ids_service, list(request.post_ids), True, request.include_unapproved
+        )
+        return post_pb2.GetPostsByIdsResponse(posts=[_post_message(post) for post in posts])
+
+    async def GetPostSummariesByCreator(self, request, context):
+        posts, next_cursor = await self._run(
+            context, get_creator_post_summaries_service, request.creator_id, request.cursor, request.limit
+        )
+        return post_pb2.GetPostSummariesByCreatorResponse(
+            posts=[_post_summary_message(post) for post in posts],
+            next_cursor=next_cursor or ''
+        )
+
+    async def CountPostsByTag(self, request, context):
+        await self._check_batch(context, request.tag_ids)
+        counts = await self._run(context, count_posts_by_tag_service, list(request.tag_ids))
+        return post_pb2.CountPostsByTagResponse(counts=counts)
+
+    def _export_batches(self, after_id, include_unapproved):
         with self.app.app_context():
-            success = remove_tag_from_all_posts_service(request.tag_id)
-            return post_pb2.RemoveTagResponse(success=success)
+            for posts in iter_post_batches_for_export(after_id, include_unapproved, self.export_batch_size):
+                yield [_post_message(post) for post in posts]
+
+    async def ExportPosts(self, request, context):
+        """Потоковая выгрузка постов по возрастанию id.
+
+        Курсор базы живёт в отдельном потоке выгрузки; следующая пачка читается только
+        после того, как предыдущая ушла в поток ответа. Так медленный клиент через
+        flow control HTTP/2 притормаживает чтение из базы, а не копит посты в памяти.
+        """
+        if self._exports.locked():
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, 'Слишком много одновременных выгрузок')
+
+        async with self._exports:
+            loop = asyncio.get_running_loop()
+            # Один поток на выгрузку: серверный курсор и app context нельзя передавать между потоками.
+            reader = futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='grpc-export')
+            batches = self._export_batches(request.after_id, request.include_unapproved)
+            try:
+                while True:
+                    batch = await loop.run_in_executor(reader, next, batches, None)
+                    if batch is None:
+                        break
+                    for message in batch:
+                        yield message
+            finally:
+                # close() выполнится в том же потоке после текущего чтения и освободит курсор.
+                reader.submit(batches.close)
+                reader.shutdown(wait=False)
+
+
+def create_grpc_server(app, executor):
+    server = grpc.aio.server(
+        maximum_concurrent_rpcs=app.config['GRPC_MAX_CONCURRENT_RPCS'],
+        compression=_COMPRESSION[app.config['GRPC_COMPRESSION']],
+        options=[
+            ('grpc.keepalive_time_ms', app.config['GRPC_KEEPALIVE_TIME_MS']),
+            ('grpc.keepalive_timeout_ms', app.config['GRPC_KEEPALIVE_TIMEOUT_MS']),
+            ('grpc.keepalive_permit_without_calls', 1),
+            ('grpc.http2.max_pings_without_data', 0),
+            ('grpc.http2.min_ping_interval_without_data_ms', app.config['GRPC_KEEPALIVE_TIME_MS'] // 2),
+        ]
+    )
+    post_pb2_grpc.add_gRPCPostServiceServicer_to_server(gRPCPostService(app, executor), server)
+    server.add_insecure_port(f"0.0.0.0:{app.config['GRPC_PORT']}")
+    return server
+
+
+async def _serve(app, handle_signals):
+    executor = futures.ThreadPoolExecutor(max_workers=app.config['GRPC_WORKERS'], thread_name_prefix='grpc-db')
+    server = create_grpc_server(app, executor)
+
+    if handle_signals:
+        loop = asyncio.get_running_loop()
+
+        def stop():
+            print("Post gRPC Server stopping...")
+            asyncio.ensure_future(server.stop(app.config['GRPC_GRACE_PERIOD']))
+
+        loop.add_signal_handler(signal.SIGTERM, stop)
+        loop.add_signal_handler(signal.SIGINT, stop)
+
+    await server.start()
+    print(f"Post gRPC Server started on port {app.config['GRPC_PORT']}")
+    try:
+        await server.wait_for_termination()
+    finally:
+        executor.shutdown(wait=True)
+
 
 def run_grpc_server(app):
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    post_pb2_grpc.add_gRPCPostServiceServicer_to_server(gRPCPostService(app), server)
-    server.add_insecure_port('0.0.0.0:50055')
-    print("Post gRPC Server started on port 50055")
-    server.start()
-    server.wait_for_termination()
+    # Запуск в отдельном потоке рядом с dev-сервером Flask (app.py); сигналы обрабатывает главный поток.
+    asyncio.run(_serve(app, handle_signals=False))
+
+
+def serve(app):
+    """Отдельный процесс gRPC-сервера с корректной остановкой.
+
+    По SIGTERM/SIGINT сервер перестаёт принимать новые вызовы и даёт текущим
+    до GRPC_GRACE_PERIOD секунд на завершение.
+    """
+    asyncio.run(_serve(app, handle_signals=True))
+    print("Post gRPC Server stopped")
+
+
+if __name__ == '__main__':
+    # python -m src.grpc_server.post_server
+    from src import create_app
+    serve(create_app())
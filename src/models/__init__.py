@@ -4,5 +4,6 @@ from .image_in_post import ImageInPost
 from .video_in_post import VideoInPost
 from .text_in_post import TextInPost
 from .user_actions import UserActions
+from .post_search_document import PostSearchDocument
 
-__all__ = ['Post', 'TagInPost', 'ImageInPost', 'VideoInPost', 'TextInPost', 'UserActions']
\ No newline at end of file
+__all__ = ['Post', 'TagInPost', 'ImageInPost', 'VideoInPost', 'TextInPost', 'UserActions', 'PostSearchDocument']
\ No newline at end of file
@@ -6,7 +6,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 class ImageInPost(db.Model):
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    address: Mapped[str] = mapped_column(db.String)
+    address: Mapped[Optional[str]] = mapped_column(db.String, nullable=True)
     description: Mapped[str] = mapped_column(db.String(255))
 
     post_id: Mapped[int] = mapped_column(ForeignKey('post.id'))
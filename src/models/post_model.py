@@ -1,21 +1,33 @@
 from ..db import db
 from typing import Optional
-from datetime import datetime, timezone
-from sqlalchemy import ForeignKey
+from datetime import datetime, date, timezone
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import json
 
 class Post(db.Model):
     id: Mapped[int] = mapped_column(primary_key=True)
-    address: Mapped[str] = mapped_column(db.String(250))
+    address: Mapped[str] = mapped_column(db.String(250), unique=True)
     header: Mapped[str] = mapped_column(db.String(150))
-    main_image: Mapped[str] = mapped_column(db.String)
+    main_image: Mapped[Optional[str]] = mapped_column(db.String, nullable=True)
     date_range: Mapped[str] = mapped_column(db.String)
+    history_start: Mapped[Optional[date]] = mapped_column(db.Date, nullable=True)
+    history_end: Mapped[Optional[date]] = mapped_column(db.Date, nullable=True)
+    history_year_only: Mapped[bool] = mapped_column(db.Boolean, default=False)
+    history_sort_key: Mapped[date] = mapped_column(db.Date, nullable=False, default=date.min,
+                                                   server_default=date.min.isoformat())
     creator_id: Mapped[str] = mapped_column(db.Integer)
     structure: Mapped[str] = mapped_column(db.String)
     lead: Mapped[str] = mapped_column(db.String(250))
     is_approved: Mapped[bool] = mapped_column(db.Boolean)
     reviewer: Mapped[str] = mapped_column(db.String)
+    likes_count: Mapped[int] = mapped_column(db.Integer, nullable=False, default=0, server_default='0')
+    views_count: Mapped[int] = mapped_column(db.Integer, nullable=False, default=0, server_default='0')
+    processing_status: Mapped[str] = mapped_column(db.String(20), nullable=False, default='ready',
+                                                   server_default='ready')
+    pending_images: Mapped[int] = mapped_column(db.Integer, nullable=False, default=0, server_default='0')
+    # Увеличивается при каждом изменении содержимого поста; ключ кэша ответов get_post.
+    version: Mapped[int] = mapped_column(db.Integer, nullable=False, default=1, server_default='1')
 
     tags_in_post: Mapped[list['TagInPost']] = relationship(
         'TagInPost', back_populates='post', cascade='all, delete-orphan', overlaps='tags_in_post'
@@ -36,5 +48,14 @@ class Post(db.Model):
     created_at: Mapped[datetime] = mapped_column(db.DateTime, index=True, default=lambda: datetime.now(timezone.utc))
     deleted_at: Mapped[Optional[datetime]] = mapped_column(db.DateTime, nullable=True)
 
+    __table_args__ = (
+        Index('ix_post_created_at_id', 'created_at', 'id'),
+        Index('ix_post_creator_created', 'creator_id', 'created_at', 'id'),
+        Index('ix_post_address_pattern', 'address', postgresql_ops={'address': 'varchar_pattern_ops'})
+        .ddl_if(dialect='postgresql'),
+        Index('ix_post_history_range', 'history_start', 'history_end'),
+        Index('ix_post_history_sort', 'history_sort_key', 'created_at', 'id'),
+    )
+
     def soft_delete(self):
         self.deleted_at = datetime.now()
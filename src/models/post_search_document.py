@@ -0,0 +1,15 @@
+from ..db import db
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column
+
+class PostSearchDocument(db.Model):
+    post_id: Mapped[int] = mapped_column(ForeignKey('post.id', ondelete='CASCADE'), primary_key=True)
+    header: Mapped[str] = mapped_column(db.Text, default='')
+    lead: Mapped[str] = mapped_column(db.Text, default='')
+    body: Mapped[str] = mapped_column(db.Text, default='')
+    search_vector = mapped_column(TSVECTOR().with_variant(db.Text, 'sqlite'), nullable=True)
+
+    __table_args__ = (
+        Index('ix_post_search_document_vector', 'search_vector', postgresql_using='gin').ddl_if(dialect='postgresql'),
+    )
@@ -1,7 +1,7 @@
 from ..db import db
 from typing import Optional
 from datetime import datetime, timezone
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 class UserActions(db.Model):
@@ -15,5 +15,7 @@ class UserActions(db.Model):
     created_at: Mapped[datetime] = mapped_column(db.DateTime, index=True, default=lambda: datetime.now())
     deleted_at: Mapped[Optional[datetime]] = mapped_column(db.DateTime, nullable=True)
 
+    __table_args__ = (UniqueConstraint('post_id', 'finger_print', name='uq_user_action_post_finger_print'),)
+
     def soft_delete(self):
         self.deleted_at = datetime.now()
@@ -24,17 +24,51 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\npost.proto\x12\x04post\"\"\n\x10RemoveTagRequest\x12\x0e\n\x06tag_id\x18\x01 \x01(\t\"$\n\x11RemoveTagResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x32X\n\x0fgRPCPostService\x12\x45\n\x12RemoveTagFromPosts\x12\x16.post.RemoveTagRequest\x1a\x17.post.RemoveTagResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\npost.proto\x12\x04post\"\"\n\x10RemoveTagRequest\x12\x0e\n\x06tag_id\x18\x01 \x01(\t\"$\n\x11RemoveTagResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"8\n\x14UpdateTagNameRequest\x12\x0e\n\x06tag_id\x18\x01 \x01(\x05\x12\x10\n\x08tag_name\x18\x02 \x01(\t\"9\n\x15UpdateTagNameResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07updated\x18\x02 \x01(\x05\"7\n\x15InvalidateUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\r\n\x05\x65mail\x18\x02 \x01(\t\")\n\x16InvalidateUserResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"+\n\x07PostTag\x12\x0e\n\x06tag_id\x18\x01 \x01(\x05\x12\x10\n\x08tag_name\x18\x02 \x01(\t\"1\n\tPostImage\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\"\xe1\x01\n\x0bPostSummary\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0e\n\x06header\x18\x03 \x01(\t\x12\x12\n\nmain_image\x18\x04 \x01(\t\x12\x0c\n\x04lead\x18\x05 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x06 \x01(\t\x12\x13\n\x0bis_approved\x18\x07 \x01(\x08\x12\x19\n\x11processing_status\x18\x08 \x01(\t\x12\x12\n\ncreated_at\x18\t \x01(\t\x12\x12\n\ndate_range\x18\n \x01(\t\x12\x1b\n\x04tags\x18\x0b \x03(\x0b\x32\r.post.PostTag\"\xf1\x02\n\x04Post\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0e\n\x06header\x18\x03 \x01(\t\x12\x12\n\nmain_image\x18\x04 \x01(\t\x12\x0c\n\x04lead\x18\x05 \x01(\t\x12\x12\n\ncreator_id\x18\x06 \x01(\x05\x12\x0e\n\x06\x61uthor\x18\x07 \x01(\t\x12\x10\n\x08reviewer\x18\x08 \x01(\t\x12\x13\n\x0bis_approved\x18\t \x01(\x08\x12\x19\n\x11processing_status\x18\n \x01(\t\x12\x12\n\ncreated_at\x18\x0b \x01(\t\x12\x12\n\ndate_range\x18\x0c \x01(\t\x12\x11\n\tstructure\x18\r \x01(\t\x12\x1b\n\x04tags\x18\x0e \x03(\x0b\x32\r.post.PostTag\x12\r\n\x05texts\x18\x0f \x03(\t\x12\x1f\n\x06images\x18\x10 \x03(\x0b\x32\x0f.post.PostImage\x12\x0e\n\x06videos\x18\x11 \x03(\t\x12\r\n\x05likes\x18\x12 \x01(\x05\x12\r\n\x05views\x18\x13 \x01(\x05\"D\n\x14GetPostsByIdsRequest\x12\x10\n\x08post_ids\x18\x01 \x03(\x05\x12\x1a\n\x12include_unapproved\x18\x02 \x01(\x08\"2\n\x15GetPostsByIdsResponse\x12\x19\n\x05posts\x18\x01 \x03(\x0b\x32\n.post.Post\"U\n GetPostSummariesByCreatorRequest\x12\x12\n\ncreator_id\x18\x01 \x01(\x05\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x0e\n\x06\x63ursor\x18\x03 \x01(\t\"Z\n!GetPostSummariesByCreatorResponse\x12 \n\x05posts\x18\x01 \x03(\x0b\x32\x11.post.PostSummary\x12\x13\n\x0bnext_cursor\x18\x02 \x01(\t\")\n\x16\x43ountPostsByTagRequest\x12\x0f\n\x07tag_ids\x18\x01 \x03(\x05\"\x83\x01\n\x17\x43ountPostsByTagResponse\x12\x39\n\x06\x63ounts\x18\x01 \x03(\x0b\x32).post.CountPostsByTagResponse.CountsEntry\x1a-\n\x0b\x43ountsEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\"B\n\x12\x45xportPostsRequest\x12\x10\n\x08\x61\x66ter_id\x18\x01 \x01(\x05\x12\x1a\n\x12include_unapproved\x18\x02 \x01(\x08\x32\xae\x04\n\x0fgRPCPostService\x12\x45\n\x12RemoveTagFromPosts\x12\x16.post.RemoveTagRequest\x1a\x17.post.RemoveTagResponse\x12H\n\rUpdateTagName\x12\x1a.post.UpdateTagNameRequest\x1a\x1b.post.UpdateTagNameResponse\x12K\n\x0eInvalidateUser\x12\x1b.post.InvalidateUserRequest\x1a\x1c.post.InvalidateUserResponse\x12H\n\rGetPostsByIds\x12\x1a.post.GetPostsByIdsRequest\x1a\x1b.post.GetPostsByIdsResponse\x12l\n\x19GetPostSummariesByCreator\x12&.post.GetPostSummariesByCreatorRequest\x1a\'.post.GetPostSummariesByCreatorResponse\x12N\n\x0f\x43ountPostsByTag\x12\x1c.post.CountPostsByTagRequest\x1a\x1d.post.CountPostsByTagResponse\x12\x35\n\x0b\x45xportPosts\x12\x18.post.ExportPostsRequest\x1a\n.post.Post0\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'post_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
+  _globals['_COUNTPOSTSBYTAGRESPONSE_COUNTSENTRY']._loaded_options = None
+  _globals['_COUNTPOSTSBYTAGRESPONSE_COUNTSENTRY']._serialized_options = b'8\001'
   _globals['_REMOVETAGREQUEST']._serialized_start=20
   _globals['_REMOVETAGREQUEST']._serialized_end=54
   _globals['_REMOVETAGRESPONSE']._serialized_start=56
   _globals['_REMOVETAGRESPONSE']._serialized_end=92
-  _globals['_GRPCPOSTSERVICE']._serialized_start=94
-  _globals['_GRPCPOSTSERVICE']._serialized_end=182
+  _globals['_UPDATETAGNAMEREQUEST']._serialized_start=94
+  _globals['_UPDATETAGNAMEREQUEST']._serialized_end=150
+  _globals['_UPDATETAGNAMERESPONSE']._serialized_start=152
+  _globals['_UPDATETAGNAMERESPONSE']._serialized_end=209
+  _globals['_INVALIDATEUSERREQUEST']._serialized_start=211
+  _globals['_INVALIDATEUSERREQUEST']._serialized_end=266
+  _globals['_INVALIDATEUSERRESPONSE']._serialized_start=268
+  _globals['_INVALIDATEUSERRESPONSE']._serialized_end=309
+  _globals['_POSTTAG']._serialized_start=311
+  _globals['_POSTTAG']._serialized_end=354
+  _globals['_POSTIMAGE']._serialized_start=356
+  _globals['_POSTIMAGE']._serialized_end=405
+  _globals['_POSTSUMMARY']._serialized_start=408
+  _globals['_POSTSUMMARY']._serialized_end=633
+  _globals['_POST']._serialized_start=636
+  _globals['_POST']._serialized_end=1005
+  _globals['_GETPOSTSBYIDSREQUEST']._serialized_start=1007
+  _globals['_GETPOSTSBYIDSREQUEST']._serialized_end=1075
+  _globals['_GETPOSTSBYIDSRESPONSE']._serialized_start=1077
+  _globals['_GETPOSTSBYIDSRESPONSE']._serialized_end=1127
+  _globals['_GETPOSTSUMMARIESBYCREATORREQUEST']._serialized_start=1129
+  _globals['_GETPOSTSUMMARIESBYCREATORREQUEST']._serialized_end=1214
+  _globals['_GETPOSTSUMMARIESBYCREATORRESPONSE']._serialized_start=1216
+  _globals['_GETPOSTSUMMARIESBYCREATORRESPONSE']._serialized_end=1306
+  _globals['_COUNTPOSTSBYTAGREQUEST']._serialized_start=1308
+  _globals['_COUNTPOSTSBYTAGREQUEST']._serialized_end=1349
+  _globals['_COUNTPOSTSBYTAGRESPONSE']._serialized_start=1352
+  _globals['_COUNTPOSTSBYTAGRESPONSE']._serialized_end=1483
+  _globals['_COUNTPOSTSBYTAGRESPONSE_COUNTSENTRY']._serialized_start=1438
+  _globals['_COUNTPOSTSBYTAGRESPONSE_COUNTSENTRY']._serialized_end=1483
+  _globals['_EXPORTPOSTSREQUEST']._serialized_start=1485
+  _globals['_EXPORTPOSTSREQUEST']._serialized_end=1551
+  _globals['_GRPCPOSTSERVICE']._serialized_start=1554
+  _globals['_GRPCPOSTSERVICE']._serialized_end=2112
 # @@protoc_insertion_point(module_scope)
@@ -39,6 +39,36 @@ class gRPCPostServiceStub(object):
                 request_serializer=post__pb2.RemoveTagRequest.SerializeToString,
                 response_deserializer=post__pb2.RemoveTagResponse.FromString,
                 _registered_method=True)
+        self.UpdateTagName = channel.unary_unary(
+                '/post.gRPCPostService/UpdateTagName',
+                request_serializer=post__pb2.UpdateTagNameRequest.SerializeToString,
+                response_deserializer=post__pb2.UpdateTagNameResponse.FromString,
+                _registered_method=True)
+        self.InvalidateUser = channel.unary_unary(
+                '/post.gRPCPostService/InvalidateUser',
+                request_serializer=post__pb2.InvalidateUserRequest.SerializeToString,
+                response_deserializer=post__pb2.InvalidateUserResponse.FromString,
+                _registered_method=True)
+        self.GetPostsByIds = channel.unary_unary(
+                '/post.gRPCPostService/GetPostsByIds',
+                request_serializer=post__pb2.GetPostsByIdsRequest.SerializeToString,
+                response_deserializer=post__pb2.GetPostsByIdsResponse.FromString,
+                _registered_method=True)
+        self.GetPostSummariesByCreator = channel.unary_unary(
+                '/post.gRPCPostService/GetPostSummariesByCreator',
+                request_serializer=post__pb2.GetPostSummariesByCreatorRequest.SerializeToString,
+                response_deserializer=post__pb2.GetPostSummariesByCreatorResponse.FromString,
+                _registered_method=True)
+        self.CountPostsByTag = channel.unary_unary(
+                '/post.gRPCPostService/CountPostsByTag',
+                request_serializer=post__pb2.CountPostsByTagRequest.SerializeToString,
+                response_deserializer=post__pb2.CountPostsByTagResponse.FromString,
+                _registered_method=True)
+        self.ExportPosts = channel.unary_stream(
+                '/post.gRPCPostService/ExportPosts',
+                request_serializer=post__pb2.ExportPostsRequest.SerializeToString,
+                response_deserializer=post__pb2.Post.FromString,
+                _registered_method=True)
 
 
 class gRPCPostServiceServicer(object):
@@ -50,6 +80,42 @@ class gRPCPostServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def UpdateTagName(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def InvalidateUser(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetPostsByIds(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetPostSummariesByCreator(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CountPostsByTag(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ExportPosts(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_gRPCPostServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -58,6 +124,36 @@ def add_gRPCPostServiceServicer_to_server(servicer, server):
                     request_deserializer=post__pb2.RemoveTagRequest.FromString,
                     response_serializer=post__pb2.RemoveTagResponse.SerializeToString,
             ),
+            'UpdateTagName': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateTagName,
+                    request_deserializer=post__pb2.UpdateTagNameRequest.FromString,
+                    response_serializer=post__pb2.UpdateTagNameResponse.SerializeToString,
+            ),
+            'InvalidateUser': grpc.unary_unary_rpc_method_handler(
+                    servicer.InvalidateUser,
+                    request_deserializer=post__pb2.InvalidateUserRequest.FromString,
+                    response_serializer=post__pb2.InvalidateUserResponse.SerializeToString,
+            ),
+            'GetPostsByIds': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetPostsByIds,
+                    request_deserializer=post__pb2.GetPostsByIdsRequest.FromString,
+                    response_serializer=post__pb2.GetPostsByIdsResponse.SerializeToString,
+            ),
+            'GetPostSummariesByCreator': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetPostSummariesByCreator,
+                    request_deserializer=post__pb2.GetPostSummariesByCreatorRequest.FromString,
+                    response_serializer=post__pb2.GetPostSummariesByCreatorResponse.SerializeToString,
+            ),
+            'CountPostsByTag': grpc.unary_unary_rpc_method_handler(
+                    servicer.CountPostsByTag,
+                    request_deserializer=post__pb2.CountPostsByTagRequest.FromString,
+                    response_serializer=post__pb2.CountPostsByTagResponse.SerializeToString,
+            ),
+            'ExportPosts': grpc.unary_stream_rpc_method_handler(
+                    servicer.ExportPosts,
+                    request_deserializer=post__pb2.ExportPostsRequest.FromString,
+                    response_serializer=post__pb2.Post.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'post.gRPCPostService', rpc_method_handlers)
@@ -95,3 +191,165 @@ class gRPCPostService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def UpdateTagName(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/post.gRPCPostService/UpdateTagName',
+            post__pb2.UpdateTagNameRequest.SerializeToString,
+            post__pb2.UpdateTagNameResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def InvalidateUser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/post.gRPCPostService/InvalidateUser',
+            post__pb2.InvalidateUserRequest.SerializeToString,
+            post__pb2.InvalidateUserResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetPostsByIds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/post.gRPCPostService/GetPostsByIds',
+            post__pb2.GetPostsByIdsRequest.SerializeToString,
+            post__pb2.GetPostsByIdsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetPostSummariesByCreator(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/post.gRPCPostService/GetPostSummariesByCreator',
+            post__pb2.GetPostSummariesByCreatorRequest.SerializeToString,
+            post__pb2.GetPostSummariesByCreatorResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CountPostsByTag(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/post.gRPCPostService/CountPostsByTag',
+            post__pb2.CountPostsByTagRequest.SerializeToString,
+            post__pb2.CountPostsByTagResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ExportPosts(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/post.gRPCPostService/ExportPosts',
+            post__pb2.ExportPostsRequest.SerializeToString,
+            post__pb2.Post.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\ttag.proto\x12\x03tag\"#\n\x11GetTagByIdRequest\x12\x0e\n\x06tag_id\x18\x01 \x01(\x05\".\n\x12GetTagByIdResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t2O\n\x0egRPCTagService\x12=\n\nGetTagById\x12\x16.tag.GetTagByIdRequest\x1a\x17.tag.GetTagByIdResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\ttag.proto\x12\x03tag\"#\n\x11GetTagByIdRequest\x12\x0e\n\x06tag_id\x18\x01 \x01(\x05\".\n\x12GetTagByIdResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"&\n\x13GetTagsByIdsRequest\x12\x0f\n\x07tag_ids\x18\x01 \x03(\x05\"=\n\x14GetTagsByIdsResponse\x12%\n\x04tags\x18\x01 \x03(\x0b\x32\x17.tag.GetTagByIdResponse2\x94\x01\n\x0egRPCTagService\x12=\n\nGetTagById\x12\x16.tag.GetTagByIdRequest\x1a\x17.tag.GetTagByIdResponse\x12\x43\n\x0cGetTagsByIds\x12\x18.tag.GetTagsByIdsRequest\x1a\x19.tag.GetTagsByIdsResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -35,6 +35,10 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_GETTAGBYIDREQUEST']._serialized_end=53
   _globals['_GETTAGBYIDRESPONSE']._serialized_start=55
   _globals['_GETTAGBYIDRESPONSE']._serialized_end=101
-  _globals['_GRPCTAGSERVICE']._serialized_start=103
-  _globals['_GRPCTAGSERVICE']._serialized_end=182
+  _globals['_GETTAGSBYIDSREQUEST']._serialized_start=103
+  _globals['_GETTAGSBYIDSREQUEST']._serialized_end=141
+  _globals['_GETTAGSBYIDSRESPONSE']._serialized_start=143
+  _globals['_GETTAGSBYIDSRESPONSE']._serialized_end=204
+  _globals['_GRPCTAGSERVICE']._serialized_start=207
+  _globals['_GRPCTAGSERVICE']._serialized_end=355
 # @@protoc_insertion_point(module_scope)
@@ -39,6 +39,11 @@ class gRPCTagServiceStub(object):
                 request_serializer=tag__pb2.GetTagByIdRequest.SerializeToString,
                 response_deserializer=tag__pb2.GetTagByIdResponse.FromString,
                 _registered_method=True)
+        self.GetTagsByIds = channel.unary_unary(
+                '/tag.gRPCTagService/GetTagsByIds',
+                request_serializer=tag__pb2.GetTagsByIdsRequest.SerializeToString,
+                response_deserializer=tag__pb2.GetTagsByIdsResponse.FromString,
+                _registered_method=True)
 
 
 class gRPCTagServiceServicer(object):
@@ -50,6 +55,12 @@ class gRPCTagServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetTagsByIds(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_gRPCTagServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -58,6 +69,11 @@ def add_gRPCTagServiceServicer_to_server(servicer, server):
                     request_deserializer=tag__pb2.GetTagByIdRequest.FromString,
                     response_serializer=tag__pb2.GetTagByIdResponse.SerializeToString,
             ),
+            'GetTagsByIds': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetTagsByIds,
+                    request_deserializer=tag__pb2.GetTagsByIdsRequest.FromString,
+                    response_serializer=tag__pb2.GetTagsByIdsResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'tag.gRPCTagService', rpc_method_handlers)
@@ -95,3 +111,30 @@ class gRPCTagService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetTagsByIds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/tag.gRPCTagService/GetTagsByIds',
+            tag__pb2.GetTagsByIdsRequest.SerializeToString,
+            tag__pb2.GetTagsByIdsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nuser.proto\x12\x04user\"&\n\x15GetUserByEmailRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"`\n\x16GetUserByEmailResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0f\n\x07surname\x18\x04 \x01(\t\x12\x0c\n\x04role\x18\x05 \x01(\t\"%\n\x12GetUserByIdRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"]\n\x13GetUserByIdResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0f\n\x07surname\x18\x04 \x01(\t\x12\x0c\n\x04role\x18\x05 \x01(\t2\xa2\x01\n\x0fgRPCUserService\x12K\n\x0eGetUserByEmail\x12\x1b.user.GetUserByEmailRequest\x1a\x1c.user.GetUserByEmailResponse\x12\x42\n\x0bGetUserById\x12\x18.user.GetUserByIdRequest\x1a\x19.user.GetUserByIdResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nuser.proto\x12\x04user\"&\n\x15GetUserByEmailRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"`\n\x16GetUserByEmailResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0f\n\x07surname\x18\x04 \x01(\t\x12\x0c\n\x04role\x18\x05 \x01(\t\"%\n\x12GetUserByIdRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"]\n\x13GetUserByIdResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0f\n\x07surname\x18\x04 \x01(\t\x12\x0c\n\x04role\x18\x05 \x01(\t\"(\n\x14GetUsersByIdsRequest\x12\x10\n\x08user_ids\x18\x01 \x03(\x05\"A\n\x15GetUsersByIdsResponse\x12(\n\x05users\x18\x01 \x03(\x0b\x32\x19.user.GetUserByIdResponse2\xec\x01\n\x0fgRPCUserService\x12K\n\x0eGetUserByEmail\x12\x1b.user.GetUserByEmailRequest\x1a\x1c.user.GetUserByEmailResponse\x12\x42\n\x0bGetUserById\x12\x18.user.GetUserByIdRequest\x1a\x19.user.GetUserByIdResponse\x12H\n\rGetUsersByIds\x12\x1a.user.GetUsersByIdsRequest\x1a\x1b.user.GetUsersByIdsResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -39,6 +39,10 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_GETUSERBYIDREQUEST']._serialized_end=195
   _globals['_GETUSERBYIDRESPONSE']._serialized_start=197
   _globals['_GETUSERBYIDRESPONSE']._serialized_end=290
-  _globals['_GRPCUSERSERVICE']._serialized_start=293
-  _globals['_GRPCUSERSERVICE']._serialized_end=455
+  _globals['_GETUSERSBYIDSREQUEST']._serialized_start=292
+  _globals['_GETUSERSBYIDSREQUEST']._serialized_end=332
+  _globals['_GETUSERSBYIDSRESPONSE']._serialized_start=334
+  _globals['_GETUSERSBYIDSRESPONSE']._serialized_end=399
+  _globals['_GRPCUSERSERVICE']._serialized_start=402
+  _globals['_GRPCUSERSERVICE']._serialized_end=638
 # @@protoc_insertion_point(module_scope)
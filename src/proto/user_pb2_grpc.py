@@ -44,6 +44,11 @@ class gRPCUserServiceStub(object):
                 request_serializer=user__pb2.GetUserByIdRequest.SerializeToString,
                 response_deserializer=user__pb2.GetUserByIdResponse.FromString,
                 _registered_method=True)
+        self.GetUsersByIds = channel.unary_unary(
+                '/user.gRPCUserService/GetUsersByIds',
+                request_serializer=user__pb2.GetUsersByIdsRequest.SerializeToString,
+                response_deserializer=user__pb2.GetUsersByIdsResponse.FromString,
+                _registered_method=True)
 
 
 class gRPCUserServiceServicer(object):
@@ -61,6 +66,12 @@ class gRPCUserServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetUsersByIds(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_gRPCUserServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -74,6 +85,11 @@ def add_gRPCUserServiceServicer_to_server(servicer, server):
                     request_deserializer=user__pb2.GetUserByIdRequest.FromString,
                     response_serializer=user__pb2.GetUserByIdResponse.SerializeToString,
             ),
+            'GetUsersByIds': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetUsersByIds,
+                    request_deserializer=user__pb2.GetUsersByIdsRequest.FromString,
+                    response_serializer=user__pb2.GetUsersByIdsResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'user.gRPCUserService', rpc_method_handlers)
@@ -138,3 +154,30 @@ class gRPCUserService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetUsersByIds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/user.gRPCUserService/GetUsersByIds',
+            user__pb2.GetUsersByIdsRequest.SerializeToString,
+            user__pb2.GetUsersByIdsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,158 @@
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from sqlalchemy import update, case
+
+from ..db import db
+from ..models import Post
+from ..utils.post_utils import prepare_image_upload, process_image
+from ..utils.storage import asset_storage
+
+
+class ImageProcessor:
+    """Фоновая обработка изображений постов в пуле процессов.
+
+    В потоке запроса для каждого изображения только вычисляется путь в хранилище (по хэшу
+    содержимого); уже сохранённые изображения повторно не обрабатываются. Сама обработка —
+    декодирование, масштабирование и запись всех вариантов ширины — ставится в пул после коммита.
+    Пока у поста есть необработанные изображения, его processing_status равен 'processing';
+    когда пакет изображений готов, статус становится 'ready' (или 'failed' при ошибке).
+    При max_workers = 0 изображения обрабатываются синхронно.
+    """
+
+    def __init__(self, app=None):
+        self.app = None
+        self._pool = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.processed = 0
+        self.failed = 0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        self.max_workers = app.config.get('IMAGE_WORKERS', 2)
+        self.variant_widths = tuple(app.config.get('IMAGE_VARIANT_WIDTHS', ()))
+        atexit.register(self.shutdown)
+
+    def _ensure_pool(self):
+        # spawn, а не fork: процесс приложения держит потоки gRPC и соединения с базой.
+        with self._lock:
+            if self._pool is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._pool
+
+    def _reset_pool(self):
+        with self._lock:
+            self._pool = None
+
+    def reserve(self, jobs, image):
+        """Возвращает путь изображения в хранилище и, если его там ещё нет, добавляет задание в jobs.
+
+        Путь уже сохранённого изображения (например, отправленный обратно при редактировании)
+        возвращается как есть.
+        """
+        if asset_storage.is_stored_path(image):
+            return image
+
+        source, image_path = prepare_image_upload(image, asset_storage)
+        if not asset_storage.exists(image_path) and all(path != image_path for _, path in jobs):
+            jobs.append((source, image_path))
+        return image_path
+
+    def submit(self, post_id, jobs):
+        """Отправляет пакет изображений поста в обработку. Вызывать после коммита."""
+        if not jobs:
+            return
+
+        if not self.max_workers:
+            failed = 0
+            for source, image_path in jobs:
+                failed += not self._process_inline(source, image_path)
+            self._finish(post_id, len(jobs), failed)
+            return
+
+        try:
+            futures = self._submit_jobs(jobs)
+        except BrokenProcessPool:
+            self._reset_pool()
+            futures = self._submit_jobs(jobs)
+
+        batch = {'left': len(futures), 'failed': 0}
+        with self._lock:
+            self.in_flight += len(futures)
+
+        def on_done(future):
+            with self._lock:
+                self.in_flight -= 1
+                batch['left'] -= 1
+                if future.exception() is not None:
+                    batch['failed'] += 1
+                    print(f"Ошибка при обработке изображения: {future.exception()}")
+                is_last = batch['left'] == 0
+            if is_last:
+                self._finish(post_id, len(futures), batch['failed'])
+
+        for future in futures:
+            future.add_done_callback(on_done)
+
+    def _submit_jobs(self, jobs):
+        pool = self._ensure_pool()
+        return [
+            pool.submit(process_image, asset_storage, source, image_path, self.variant_widths)
+            for source, image_path in jobs
+        ]
+
+    def _process_inline(self, source, image_path):
+        try:
+            process_image(asset_storage, source, image_path, self.variant_widths)
+            return True
+        except Exception as e:
+            print(f"Ошибка при обработке изображения: {e}")
+            return False
+
+    def _finish(self, post_id, count, failed):
+        with self._lock:
+            self.processed += count - failed
+            self.failed += failed
+
+        remaining = Post.pending_images - count
+        status = 'failed' if failed else case((remaining > 0, Post.processing_status), else_='ready')
+        try:
+            with self.app.app_context():
+                db.session.execute(
+                    update(Post)
+                    .where(Post.id == post_id)
+                    .values(pending_images=remaining, processing_status=status, version=Post.version + 1)
+                )
+                db.session.commit()
+        except Exception as e:
+            print(f"Ошибка обновления статуса обработки поста {post_id}: {e}")
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None and self._pid == os.getpid():
+            pool.shutdown(wait=True)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'workers': self.max_workers,
+                'in_flight': self.in_flight,
+                'processed': self.processed,
+                'failed': self.failed
+            }
+
+
+image_processor = ImageProcessor()
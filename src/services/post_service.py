@@ -1,13 +1,23 @@
-from datetime import datetime
+from datetime import datetime, date
 import grpc
-from sqlalchemy import and_, or_, exists
+from sqlalchemy import and_, or_, exists, func, tuple_, update, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
 from flask import jsonify
 import json
 
 from ..db import db
+from ..config import Config
 from ..models import Post, TagInPost, ImageInPost, VideoInPost, TextInPost, UserActions
-from ..utils.post_utils import save_image, generate_post_address, convert_json_date_to_sqlite_format, \
-    parse_post_dates, highlight_match
+from ..utils.post_utils import generate_post_address, parse_history_date, get_history_dates, \
+    encode_cursor, decode_cursor, image_variants, allowed_file
+from ..utils.cache import TTLCache
+from ..utils.db_utils import dialect_insert
+from ..utils.storage import asset_storage
+from .search_index import get_search_index
+from .suggest_index import SuggestionIndex
+from .view_recorder import view_recorder
+from .image_processor import image_processor
 from ..proto import user_pb2, user_pb2_grpc, tag_pb2, tag_pb2_grpc
 
 user_channel = grpc.insecure_channel('127.0.0.1:50053') # 127.0.0.1 / user-api
@@ -16,43 +26,253 @@ user_stub = user_pb2_grpc.gRPCUserServiceStub(user_channel)
 tag_channel = grpc.insecure_channel('127.0.0.1:50054') # 127.0.0.1 / tag-api
 tag_stub = tag_pb2_grpc.gRPCTagServiceStub(tag_channel)
 
-def get_user_by_email(email):
+user_cache = TTLCache(maxsize=Config.LOOKUP_CACHE_SIZE, ttl=Config.USER_CACHE_TTL,
+                      negative_ttl=Config.NEGATIVE_CACHE_TTL)
+tag_cache = TTLCache(maxsize=Config.LOOKUP_CACHE_SIZE, ttl=Config.TAG_CACHE_TTL,
+                     negative_ttl=Config.NEGATIVE_CACHE_TTL)
+suggestion_index = SuggestionIndex(ttl=Config.SUGGEST_INDEX_TTL)
+# Неизменяемая часть ответа get_post по ключу (post_id, version); is_liked и счётчики подставляются отдельно.
+post_cache = TTLCache(maxsize=Config.POST_CACHE_SIZE, ttl=Config.POST_CACHE_TTL)
+
+
+def _user_to_dict(response):
+    return {
+        'id': response.id,
+        'email': response.email,
+        'name': response.name,
+        'surname': response.surname,
+        'role': response.role
+    }
+
+
+def _cache_user(user):
+    user_cache.set(('id', int(user['id'])), user)
+    user_cache.set(('email', user['email']), user)
+
+
+def get_user_by_email(email, fresh=False):
+    """Пользователь по email из кэша или user-api.
+
+    Проверки прав вызывают с fresh=True: InvalidateUser приходит только в gRPC-процесс,
+    и кэш веб-воркера хранил бы отозванную роль до USER_CACHE_TTL.
+    """
+    found, user = (False, None) if fresh else user_cache.lookup(('email', email))
+    if found:
+        return user
+
     try:
         response = user_stub.GetUserByEmail(user_pb2.GetUserByEmailRequest(email=email))
-        return {
-            'id': response.id,
-            'email': response.email,
-            'name': response.name,
-            'surname': response.surname,
-            'role': response.role
-        }
+        user = _user_to_dict(response)
+        _cache_user(user)
+        return user
     except grpc.RpcError as e:
+        if e.code() == grpc.StatusCode.NOT_FOUND:
+            user_cache.set_missing(('email', email))
         print(f"Error fetching user by email: {e}")
         return None
 
 def get_user_by_id(user_id):
-    response = user_stub.GetUserById(user_pb2.GetUserByIdRequest(user_id=user_id))
-    return {
-            'id': response.id,
-            'email': response.email,
-            'name': response.name,
-            'surname': response.surname,
-            'role': response.role
-        }
+    found, user = user_cache.lookup(('id', int(user_id)))
+    if found:
+        return user
+
+    try:
+        response = user_stub.GetUserById(user_pb2.GetUserByIdRequest(user_id=user_id))
+        user = _user_to_dict(response)
+        _cache_user(user)
+        return user
+    except grpc.RpcError as e:
+        if e.code() == grpc.StatusCode.NOT_FOUND:
+            user_cache.set_missing(('id', int(user_id)))
+        print(f"Error fetching user by ID: {e}")
+        return None
+
+def get_users_by_ids(user_ids):
+    user_ids = sorted({int(user_id) for user_id in user_ids if user_id is not None})
+    users = {}
+    missing_ids = []
+
+    for user_id in user_ids:
+        found, user = user_cache.lookup(('id', user_id))
+        if not found:
+            missing_ids.append(user_id)
+        elif user:
+            users[user_id] = user
+
+    if not missing_ids:
+        return users
+
+    try:
+        response = user_stub.GetUsersByIds(user_pb2.GetUsersByIdsRequest(user_ids=missing_ids))
+        for user in map(_user_to_dict, response.users):
+            _cache_user(user)
+            users[int(user['id'])] = user
+
+        for user_id in missing_ids:
+            if user_id not in users:
+                user_cache.set_missing(('id', user_id))
+    except grpc.RpcError as e:
+        if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+            print(f"Error fetching users by IDs: {e}")
+            return users
+        # user-api без пакетного метода: поштучные запросы.
+        for user_id in missing_ids:
+            user = get_user_by_id(user_id)
+            if user:
+                users[user_id] = user
+
+    return users
+
+def get_tag_by_id(tag_id, fresh=False):
+    found, tag = (False, None) if fresh else tag_cache.lookup(int(tag_id))
+    if found:
+        return tag
 
-def get_tag_by_id(tag_id):
     try:
         response = tag_stub.GetTagById(tag_pb2.GetTagByIdRequest(tag_id=tag_id))
-        return {
+        tag = {
             'id': response.id,
             'name': response.name
         }
+        tag_cache.set(int(tag_id), tag)
+        return tag
     except grpc.RpcError as e:
+        if e.code() == grpc.StatusCode.NOT_FOUND:
+            tag_cache.set_missing(int(tag_id))
         print(f"Error fetching tag by ID: {e}")
         return None
 
 
+def get_tags_by_ids(tag_ids, fresh=False):
+    """Теги по id из кэша, недостающие — одним вызовом tag-api.
+
+    fresh=True — мимо кэша: кэш свой в каждом воркере, и переименование или удаление тега,
+    пришедшее по gRPC в другой процесс, до него не доходит.
+    """
+    tag_ids = sorted({int(tag_id) for tag_id in tag_ids})
+    tags = {}
+    missing_ids = []
+
+    for tag_id in tag_ids:
+        found, tag = (False, None) if fresh else tag_cache.lookup(tag_id)
+        if not found:
+            missing_ids.append(tag_id)
+        elif tag:
+            tags[tag_id] = tag
+
+    if not missing_ids:
+        return tags
+
+    try:
+        response = tag_stub.GetTagsByIds(tag_pb2.GetTagsByIdsRequest(tag_ids=missing_ids))
+        for tag in response.tags:
+            tags[int(tag.id)] = {'id': tag.id, 'name': tag.name}
+            tag_cache.set(int(tag.id), tags[int(tag.id)])
+
+        for tag_id in missing_ids:
+            if tag_id not in tags:
+                tag_cache.set_missing(tag_id)
+    except grpc.RpcError as e:
+        if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+            print(f"Error fetching tags by IDs: {e}")
+            return tags
+        # tag-api без пакетного метода: поштучные запросы.
+        for tag_id in missing_ids:
+            tag = get_tag_by_id(tag_id, fresh)
+            if tag:
+                tags[tag_id] = tag
+
+    return tags
+
+
+def invalidate_user_cache(user_id=None, email=None):
+    if user_id:
+        user = user_cache.invalidate(('id', int(user_id)))
+        if user:
+            user_cache.invalidate(('email', user['email']))
+    if email:
+        user = user_cache.invalidate(('email', email))
+        if user:
+            user_cache.invalidate(('id', int(user['id'])))
+    # Имя автора входит в закэшированные ответы постов, а индекса по автору у кэша нет.
+    post_cache.clear()
+
+
+def get_cache_stats_service():
+    return {
+        'users': user_cache.stats(),
+        'tags': tag_cache.stats(),
+        'posts': post_cache.stats(),
+        'suggestions': suggestion_index.stats()
+    }
+
+
+def _get_author_name(user):
+    return f"{user.get('name')} {user.get('surname')}" if user else "Неизвестный автор"
+
+
+def _post_summary_options():
+    return (
+        selectinload(Post.tags_in_post.and_(TagInPost.deleted_at.is_(None))),
+        selectinload(Post.texts_in_post.and_(TextInPost.deleted_at.is_(None))),
+    )
+
+
+def _post_detail_options():
+    return _post_summary_options() + (
+        selectinload(Post.images_in_post.and_(ImageInPost.deleted_at.is_(None))),
+        selectinload(Post.videos_in_post.and_(VideoInPost.deleted_at.is_(None))),
+    )
+
+
+def _serialize_post_summary(post, users):
+    return {
+        'id': post.id,
+        'address': post.address,
+        'header': post.header,
+        'main_image': post.main_image,
+        'main_image_variants': image_variants(post.main_image, Config.IMAGE_VARIANT_WIDTHS),
+        'date_range': json.loads(post.date_range),
+        'created_at': post.created_at,
+        'is_approved': post.is_approved,
+        'processing_status': post.processing_status,
+        'tags': [{'tag_id': tag.tag_id, 'tag_name': tag.tag_name} for tag in post.tags_in_post],
+        'text': [{'text': text.text} for text in post.texts_in_post],
+        'author': _get_author_name(users.get(post.creator_id)),
+        'lead': post.lead
+    }
+
+
+def _serialize_post_detail(post, users):
+    return {
+        'id': post.id,
+        'address': post.address,
+        'header': post.header,
+        'main_image': post.main_image,
+        'date_range': json.loads(post.date_range),
+        'structure': json.loads(post.structure) if post.structure else [],
+        'creator_id': post.creator_id,
+        'author': _get_author_name(users.get(post.creator_id)),
+        'created_at': post.created_at,
+        'is_approved': post.is_approved,
+        'processing_status': post.processing_status,
+        'text': [{'text': text.text} for text in post.texts_in_post],
+        'images': [
+            {'address': image.address, 'description': image.description}
+            for image in post.images_in_post
+        ],
+        'videos': [{'address': video.address} for video in post.videos_in_post],
+        'tags': [{'tag_id': tag.tag_id, 'tag_name': tag.tag_name} for tag in post.tags_in_post],
+        'lead': post.lead,
+        'reviewer': post.reviewer,
+        'is_liked': False,
+        'likes': post.likes_count,
+        'views': post.views_count
+    }
+
+
 def create_post_service(data, current_user_email):
+    image_jobs = []
     try:
         header = data.get('header')
         main_image = data.get('main_image')
@@ -68,22 +288,16 @@ def create_post_service(data, current_user_email):
             'end_date': right_date if right_date else None
         })
 
-        user = get_user_by_email(current_user_email)
+        user = get_user_by_email(current_user_email, fresh=True)
         if not user:
             return jsonify({'error': 'Пользователь не авторизован'}), 401
 
         is_approved = user.get('role') == 'poster'
         creator_id = user['id']
-        base_address = generate_post_address(header)
-        post_address = base_address
-
-        if Post.query.filter_by(address=post_address).first():
-            counter = 1
-            while Post.query.filter_by(address=post_address).first():
-                post_address = f"{base_address}_{counter}"
-                counter += 1
-
-        main_image_path = save_image(main_image, post_address, 'main_image')
+        post_address = _find_free_post_address(header)
+        main_image_path = _reserve_post_image(image_jobs, main_image)
+        structure, texts, images, videos = _collect_content(content, image_jobs)
+        tag_rows = _tag_rows(tags)
 
         new_post = Post(
             address=post_address,
@@ -91,20 +305,27 @@ def create_post_service(data, current_user_email):
             main_image=main_image_path,
             date_range=date_range,
             creator_id=creator_id,
-            structure=json.dumps([]),
+            structure=json.dumps(structure),
             is_approved=is_approved,
             lead = lead,
-            reviewer=reviewer
+            reviewer=reviewer,
+            pending_images=len(image_jobs),
+            processing_status='processing' if image_jobs else 'ready'
         )
-
-        db.session.add(new_post)
+        _set_history_dates(new_post)
+
+        _flush_with_unique_address(new_post, post_address)
+        _insert_child_rows(TextInPost, new_post.id, texts)
+        _insert_child_rows(ImageInPost, new_post.id, images)
+        _insert_child_rows(VideoInPost, new_post.id, videos)
+        _insert_child_rows(TagInPost, new_post.id, tag_rows)
+        get_search_index().index_post(new_post)
         db.session.commit()
 
-        structure = []
-        _add_content_to_post(new_post.id, content, post_address, structure)
-        _add_tags_to_post(new_post.id, tags)
-        new_post.structure = json.dumps(structure)
-        db.session.commit()
+        image_processor.submit(new_post.id, image_jobs)
+
+        if new_post.is_approved:
+            suggestion_index.upsert(new_post.id, new_post.header)
 
         return new_post
     except Exception as e:
@@ -112,10 +333,37 @@ def create_post_service(data, current_user_email):
         raise e
 
 
+def _upload_extension(mimetype, filename):
+    extension = ''
+    if mimetype and mimetype.startswith('image/'):
+        extension = mimetype.split('/', 1)[1]
+    elif filename and '.' in filename:
+        extension = filename.rsplit('.', 1)[1]
+
+    extension = extension.lower()
+    if not allowed_file(f'upload.{extension}'):
+        raise ValueError(f'Недопустимый формат изображения: {extension or mimetype}')
+    return extension
+
+
+def upload_images_service(files, current_user_email):
+    """Сохраняет загруженные файлы в хранилище и возвращает их asset id в том же порядке.
+
+    files — последовательность (поток, mimetype, имя файла); потоки читаются частями.
+    """
+    if not get_user_by_email(current_user_email, fresh=True):
+        raise PermissionError('Пользователь не авторизован')
+
+    return [
+        asset_storage.save_stream(stream, _upload_extension(mimetype, filename), max_size=Config.MAX_IMAGE_SIZE)
+        for stream, mimetype, filename in files
+    ]
+
+
 def delete_post_service(post_address, current_user_email):
     try:
         post = Post.query.filter(Post.address == post_address, Post.deleted_at.is_(None)).first()
-        user = get_user_by_email(current_user_email)
+        user = get_user_by_email(current_user_email, fresh=True)
 
         if not post:
             return jsonify({'error': 'Пост не найден'}), 404
@@ -124,7 +372,10 @@ def delete_post_service(post_address, current_user_email):
             return jsonify({'error': 'У вас недостаточно прав'}), 403
 
         post.soft_delete()
+        _bump_post_version(post)
+        get_search_index().remove_post(post.id)
         db.session.commit()
+        suggestion_index.remove(post.id)
 
         return jsonify({'message': 'Пост успешно удален'}), 200
     except Exception as e:
@@ -133,9 +384,10 @@ def delete_post_service(post_address, current_user_email):
 
 
 def edit_post_service(post_address, data, current_user_email):
+    image_jobs = []
     try:
         post = Post.query.filter(Post.address == post_address, Post.deleted_at.is_(None)).first()
-        user = get_user_by_email(current_user_email)
+        user = get_user_by_email(current_user_email, fresh=True)
 
         if not post:
             return jsonify({'error': 'Пост не найден'}), 404
@@ -143,8 +395,12 @@ def edit_post_service(post_address, data, current_user_email):
         if not user or user.get('role') not in ['poster', 'admin']:
             return jsonify({'error': 'У вас недостаточно прав'}), 403
 
+        known_images = {post.main_image}
+        known_images.update(address for address, in db.session.query(ImageInPost.address).filter(
+            ImageInPost.post_id == post.id, ImageInPost.deleted_at.is_(None)
+        ))
         if 'main_image' in data:
-            post.main_image = save_image(data['main_image'], post.address, 'main_image')
+            post.main_image = _reserve_post_image(image_jobs, data['main_image'], known_images)
 
         date_range = data['date_range']
 
@@ -156,31 +412,32 @@ def edit_post_service(post_address, data, current_user_email):
         for key, value in data.items():
             if key not in ['main_image', 'content', 'tags']:
                 setattr(post, key, value)
+        _set_history_dates(post)
+
+        structure, texts, images, videos = _collect_content(data.get('content', []), image_jobs, known_images)
+        # Новые дочерние строки вставляются через Core и не видны в сессии, поэтому учитываются отдельно.
+        inserted = _sync_child_rows(TextInPost, post.id, texts)
+        inserted |= _sync_child_rows(ImageInPost, post.id, images)
+        inserted |= _sync_child_rows(VideoInPost, post.id, videos)
+        inserted |= _sync_post_tags(post.id, data.get('tags', []))
+        post.structure = json.dumps(structure)
 
-        ImageInPost.query.filter(ImageInPost.post_id == post.id, ImageInPost.deleted_at.is_(None)).delete()
-        VideoInPost.query.filter(VideoInPost.post_id == post.id, VideoInPost.deleted_at.is_(None)).delete()
-        TagInPost.query.filter(TagInPost.post_id == post.id, TagInPost.deleted_at.is_(None)).delete()
-        TextInPost.query.filter(TextInPost.post_id == post.id).delete()
+        if image_jobs:
+            post.pending_images = Post.pending_images + len(image_jobs)
+            post.processing_status = 'processing'
 
+        if inserted or _session_has_changes():
+            _bump_post_version(post)
+            _flush_with_unique_address(post, _find_free_post_address(post.header, post.id))
+            get_search_index().index_post(post)
         db.session.commit()
 
-        structure = []
-        _add_content_to_post(post.id, data.get('content', []), post.address, structure)
-
-        _add_tags_to_post(post.id, data.get('tags', []))
+        image_processor.submit(post.id, image_jobs)
 
-        post.structure = json.dumps(structure)
-        base_address = generate_post_address(post.header)
-        post_address = base_address
-
-        if Post.query.filter_by(address=post_address).first():
-            counter = 1
-            while Post.query.filter_by(address=post_address).first():
-                post_address = f"{base_address}_{counter}"
-                counter += 1
-        post.address = post_address
-
-        db.session.commit()
+        if post.is_approved:
+            suggestion_index.upsert(post.id, post.header)
+        else:
+            suggestion_index.remove(post.id)
 
         return post
     except Exception as e:
@@ -188,13 +445,133 @@ def edit_post_service(post_address, data, current_user_email):
         return jsonify({'error': str(e)}), 500
 
 
+def _bump_post_version(post):
+    post_cache.invalidate((post.id, post.version))
+    post.version = Post.version + 1
+
+
+def bump_post_versions(post_ids):
+    """Увеличивает version у постов одним UPDATE; коммит остаётся за вызывающим."""
+    rows = db.session.execute(
+        update(Post).where(Post.id.in_(post_ids)).values(version=Post.version + 1)
+        .returning(Post.id, Post.version),
+        execution_options={'synchronize_session': False}
+    ).all()
+    for post_id, version in rows:
+        post_cache.invalidate((post_id, version - 1))
+    return len(rows)
+
+
+def _find_free_post_address(header, post_id=None):
+    base_address = generate_post_address(header)
+    pattern = base_address.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '\\_%'
+
+    query = db.session.query(Post.address).filter(
+        or_(Post.address == base_address, Post.address.like(pattern, escape='\\'))
+    )
+    if post_id:
+        query = query.filter(Post.id != post_id)
+    taken = {address for address, in query}
+
+    if base_address not in taken:
+        return base_address
+
+    suffixes = {address[len(base_address) + 1:] for address in taken}
+    counter = 1
+    while str(counter) in suffixes:
+        counter += 1
+    return f"{base_address}_{counter}"
+
+
+def _flush_with_unique_address(post, address, attempts=5):
+    for _ in range(attempts):
+        try:
+            # Адрес назначается уже внутри SAVEPOINT: при гонке откатывается только вставка поста.
+            with db.session.begin_nested():
+                post.address = address
+                db.session.add(post)
+                db.session.flush()
+            return
+        except IntegrityError as e:
+            if 'address' not in str(e.orig):
+                raise
+            address = _find_free_post_address(post.header, post.id)
+    raise ValueError('Не удалось подобрать свободный адрес поста')
+
+
+def _set_history_dates(post):
+    post.history_start, post.history_end, post.history_year_only = get_history_dates(post.date_range)
+    post.history_sort_key = post.history_start or date.min
+
+
+def _history_date_filter(start_date, end_date):
+    filter_start = parse_history_date(start_date)
+    if not filter_start:
+        return None
+
+    filter_end = parse_history_date(end_date, is_end=True)
+    if not filter_end:
+        return Post.history_start.between(date(filter_start.year, 1, 1), date(filter_start.year, 12, 31))
+
+    return and_(Post.history_start <= filter_end, Post.history_end >= filter_start)
+
+
+def _normalize_page_size(limit):
+    try:
+        limit = int(limit) if limit else Config.POSTS_PAGE_SIZE
+    except (TypeError, ValueError):
+        limit = Config.POSTS_PAGE_SIZE
+    return max(1, min(limit, Config.POSTS_MAX_PAGE_SIZE))
+
+
+CREATION_ORDER = (Post.created_at, Post.id)
+HISTORICAL_ORDER = (Post.history_sort_key, Post.created_at, Post.id)
+
+
+def _to_cursor_value(value):
+    return value.isoformat() if isinstance(value, (date, datetime)) else value
+
+
+def _from_cursor_value(column, value):
+    # Курсор приходит от клиента: значение должно подходить по типу к колонке сортировки,
+    # иначе курсор от другой выдачи дошёл бы до базы и сравнивался бы с чужой колонкой.
+    python_type = column.expression.type.python_type
+    if python_type in (date, datetime):
+        try:
+            return python_type.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise ValueError('Некорректный курсор')
+
+    accepted = (int, float) if python_type is float else python_type
+    if isinstance(value, bool) or not isinstance(value, accepted):
+        raise ValueError('Некорректный курсор')
+    return value
+
+
+def _paginate(query, columns, cursor, limit, descending=False):
+    query = query.order_by(*(column.desc() if descending else column.asc() for column in columns))
+    if cursor:
+        values = decode_cursor(cursor)
+        if len(values) != len(columns):
+            raise ValueError('Некорректный курсор')
+        after = tuple_(*(_from_cursor_value(column, value) for column, value in zip(columns, values)))
+        query = query.filter(tuple_(*columns) < after if descending else tuple_(*columns) > after)
+
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    return rows, encode_cursor(*(_to_cursor_value(getattr(rows[-1], column.key)) for column in columns))
+
+
 def get_all_posts_service(date_filter_type=None, start_date=None, end_date=None, tags_filter=None,
-                          current_user_email=None, only_not_approved=None):
+                          current_user_email=None, only_not_approved=None, cursor=None, limit=None):
     try:
         query = Post.query.filter(Post.deleted_at.is_(None))
 
         if only_not_approved:
-            user = get_user_by_email(only_not_approved)
+            user = get_user_by_email(only_not_approved, fresh=True)
             if not user or user.get('role') not in ['poster', 'admin']:
                 return 'У вас недостаточно прав'
             query = query.filter(Post.is_approved == False)
@@ -205,214 +582,77 @@ def get_all_posts_service(date_filter_type=None, start_date=None, end_date=None,
         elif not only_not_approved:
             query = query.filter(Post.is_approved == True)
 
-        if start_date:
-            filter_start = None
-            filter_end = None
+        history_filter = _history_date_filter(start_date, end_date)
+        if history_filter is not None:
+            query = query.filter(history_filter)
 
-            try:
-                if len(start_date) == 4 and start_date.isdigit():
-                    filter_start = datetime(int(start_date), 1, 1).date()
-                else:
-                    filter_start = datetime.strptime(start_date, "%Y-%m-%d").date()
-            except:
-                pass
-
-            if end_date:
-                try:
-                    if len(end_date) == 4 and end_date.isdigit():
-                        filter_end = datetime(int(end_date), 12, 31).date()
-                    else:
-                        filter_end = datetime.strptime(end_date, "%Y-%m-%d").date()
-                except:
-                    pass
-
-            if filter_start:
-                posts = query.all()
-                filtered_posts = []
-
-                for post in posts:
-                    post_start, post_end = parse_post_dates(post)
-
-                    if not post_start:
-                        continue
-
-                    post_start_year_only = post_start and (post_start.month == 1 and post_start.day == 1)
-                    post_end_year_only = post_end and (post_end.month == 12 and post_end.day == 31)
-
-                    if not filter_end:
-                        if post_start.year == filter_start.year:
-                            filtered_posts.append(post)
-                    else:
-                        if post_start_year_only and (post_end is None or post_end_year_only):
-                            if (post_start.year <= filter_end.year) and (
-                            filter_start.year <= post_end.year if post_end else post_start.year):
-                                filtered_posts.append(post)
-                        else:
-                            effective_post_end = post_end if post_end else post_start
-                            if (post_start <= filter_end) and (effective_post_end >= filter_start):
-                                filtered_posts.append(post)
-
-                query = query.filter(Post.id.in_([p.id for p in filtered_posts]))
-
-        if date_filter_type == 'creation':
-            query = query.order_by(Post.created_at.desc())
-        elif date_filter_type == 'historical':
-            posts = query.all()
-            posts_sorted = sorted(
-                posts,
-                key=lambda p: (
-                    json.loads(p.date_range).get('start_date', '0000'),
-                    p.created_at
-                )
-            )
-            result = []
-            for post in posts_sorted:
-                user = get_user_by_id(post.creator_id)
-                author = f"{user.get('name')} {user.get('surname')}" if user else "Неизвестный автор"
-
-                tags = [
-                    {'tag_id': tag_in_post.tag_id, 'tag_name': get_tag_by_id(tag_in_post.tag_id).get('name')}
-                    for tag_in_post in TagInPost.query.filter(
-                        TagInPost.post_id == post.id,
-                        TagInPost.deleted_at.is_(None)
-                    ).all()
-                ]
-
-                text = [
-                    {'text': text.text}
-                    for text in TextInPost.query.filter(
-                        TextInPost.post_id == post.id,
-                        TextInPost.deleted_at.is_(None)
-                    ).all()
-                ]
-
-                result.append({
-                    'id': post.id,
-                    'address': post.address,
-                    'header': post.header,
-                    'main_image': post.main_image,
-                    'date_range': json.loads(post.date_range),
-                    'created_at': post.created_at,
-                    'is_approved': post.is_approved,
-                    'tags': tags,
-                    'text': text,
-                    'author': author,
-                    'lead': post.lead
-                })
-            return result
+        limit = _normalize_page_size(limit)
 
         if tags_filter:
             tags_count = len(tags_filter)
             query = query.join(TagInPost).filter(TagInPost.tag_id.in_(tags_filter))
             query = query.group_by(Post.id).having(db.func.count(TagInPost.tag_id) == tags_count)
 
-        result = []
-        for post in query.all():
-            user = get_user_by_id(post.creator_id)
-            author = f"{user.get('name')} {user.get('surname')}" if user else "Неизвестный автор"
-
-            tags = [
-                {'tag_id': tag_in_post.tag_id, 'tag_name': get_tag_by_id(tag_in_post.tag_id).get('name')}
-                for tag_in_post in TagInPost.query.filter(
-                    TagInPost.post_id == post.id,
-                    TagInPost.deleted_at.is_(None)
-                ).all()
-            ]
-
-            text = [
-                {'text': text.text}
-                for text in TextInPost.query.filter(
-                    TextInPost.post_id == post.id,
-                    TextInPost.deleted_at.is_(None)
-                ).all()
-            ]
-
-            result.append({
-                'id': post.id,
-                'address': post.address,
-                'header': post.header,
-                'main_image': post.main_image,
-                'date_range': json.loads(post.date_range),
-                'created_at': post.created_at,
-                'is_approved': post.is_approved,
-                'tags': tags,
-                'text': text,
-                'author': author,
-                'lead': post.lead
-            })
-
-        return result
+        if date_filter_type == 'historical':
+            rows, next_cursor = _paginate(query.with_entities(*HISTORICAL_ORDER), HISTORICAL_ORDER, cursor, limit)
+        else:
+            rows, next_cursor = _paginate(query.with_entities(*CREATION_ORDER), CREATION_ORDER, cursor, limit,
+                                          descending=True)
+
+        return {
+            'posts': get_posts_by_ids_service([row.id for row in rows], detail=False),
+            'next_cursor': next_cursor
+        }
 
     except Exception as e:
         raise e
 
 
-def get_post_by_address_service(post_address, finger_print=None):
-    try:
-        post = Post.query.filter(Post.address == post_address, Post.deleted_at.is_(None)).first()
-        if not post:
-            return None
+def get_posts_by_ids_service(post_ids, detail=True, include_unapproved=True):
+    post_ids = list(dict.fromkeys(post_ids))
+    if not post_ids:
+        return []
 
-        user = get_user_by_id(post.creator_id)
-        author = f'{user["name"]} {user["surname"]}' if user else 'Неизвестный автор'
+    options = _post_detail_options() if detail else _post_summary_options()
+    query = Post.query.options(*options).filter(Post.id.in_(post_ids), Post.deleted_at.is_(None))
+    if not include_unapproved:
+        query = query.filter(Post.is_approved == True)
+    posts = query.all()
+    posts_by_id = {post.id: post for post in posts}
+    users = get_users_by_ids(post.creator_id for post in posts)
 
-        structure = json.loads(post.structure) if post.structure else []
+    serialize = _serialize_post_detail if detail else _serialize_post_summary
+    return [serialize(posts_by_id[post_id], users) for post_id in post_ids if post_id in posts_by_id]
 
-        text = [
-            {'text': text.text}
-            for text in TextInPost.query.filter(TextInPost.post_id == post.id, TextInPost.deleted_at.is_(None)).all()
-        ]
 
-        images = [
-            {'address': image.address, 'description': image.description}
-            for image in
-            ImageInPost.query.filter(ImageInPost.post_id == post.id, ImageInPost.deleted_at.is_(None)).all()
-        ]
+def _get_post_id_by_address(post_address):
+    return db.session.query(Post.id).filter(Post.address == post_address, Post.deleted_at.is_(None)).scalar()
 
-        videos = [
-            {'address': video.address}
-            for video in
-            VideoInPost.query.filter(VideoInPost.post_id == post.id, VideoInPost.deleted_at.is_(None)).all()
-        ]
 
-        tags = [
-            {'tag_id': tag.tag_id, 'tag_name': tag.tag_name}
-            for tag in TagInPost.query.filter(TagInPost.post_id == post.id, TagInPost.deleted_at.is_(None)).all()
-        ]
+def get_post_by_address_service(post_address, finger_print=None):
+    try:
+        row = db.session.query(Post.id, Post.version, Post.likes_count, Post.views_count) \
+            .filter(Post.address == post_address, Post.deleted_at.is_(None)).first()
+        if not row:
+            return None
+        post_id = row.id
 
         is_liked = False
-        if finger_print:
-            action = UserActions.query.filter(UserActions.finger_print == finger_print, UserActions.post_id == post.id).first()
-            if not action:
-                action = _add_view_to_post(finger_print, post.id)
-            is_liked = action.is_liked
-
-        likes = UserActions.query.filter(UserActions.is_liked == True, UserActions.post_id == post.id).count()
-        views = UserActions.query.filter(UserActions.post_id == post.id).count()
-
-
-        post_data = {
-            'id': post.id,
-            'address': post.address,
-            'header': post.header,
-            'main_image': post.main_image,
-            'date_range': json.loads(post.date_range),
-            'structure': structure,
-            'creator_id': post.creator_id,
-            'author': author,
-            'created_at': post.created_at,
-            'is_approved': post.is_approved,
-            'text': text,
-            'images': images,
-            'videos': videos,
-            'tags': tags,
-            'lead': post.lead,
-            'reviewer': post.reviewer,
-            'is_liked': is_liked,
-            'likes': likes,
-            'views': views
-        }
-
+        if finger_print and not view_recorder.is_pending(finger_print, post_id):
+            is_liked = db.session.query(UserActions.is_liked).filter(
+                UserActions.finger_print == finger_print,
+                UserActions.post_id == post_id
+            ).scalar()
+            if is_liked is None:
+                view_recorder.record(finger_print, post_id)
+                is_liked = False
+
+        found, cached = post_cache.lookup((post_id, row.version))
+        if not found:
+            cached = get_posts_by_ids_service([post_id])[0]
+            post_cache.set((post_id, row.version), cached)
+
+        post_data = dict(cached, is_liked=is_liked, likes=row.likes_count, views=row.views_count)
         return post_data
     except Exception as e:
         raise e
@@ -425,12 +665,14 @@ def approve_post_service(post_address, current_user_email):
         if not post:
             return {'error': 'Пост не найден'}, 404
 
-        user = get_user_by_email(current_user_email)
+        user = get_user_by_email(current_user_email, fresh=True)
         if not user or user.get('role') not in ['admin', 'poster']:
             return {'error': 'У вас недостаточно прав для одобрения поста'}, 403
 
         post.is_approved = True
+        _bump_post_version(post)
         db.session.commit()
+        suggestion_index.upsert(post.id, post.header)
 
         return {'message': 'Пост успешно одобрен'}
     except Exception as e:
@@ -438,59 +680,125 @@ def approve_post_service(post_address, current_user_email):
         return {'error': str(e)}, 500
 
 
+def backfill_history_dates_service(batch_size=500):
+    updated = 0
+    last_id = 0
+    while True:
+        posts = Post.query.filter(Post.id > last_id, Post.history_sort_key == date.min) \
+            .order_by(Post.id).limit(batch_size).all()
+        if not posts:
+            return updated
+
+        for post in posts:
+            _set_history_dates(post)
+            updated += post.history_start is not None
+        db.session.commit()
+        last_id = posts[-1].id
+
+
+def reindex_search_service(batch_size=500, missing_only=False):
+    """Индексирует посты пачками по id; missing_only — только живые посты без документа в индексе."""
+    search_index = get_search_index()
+    indexed = 0
+    last_id = 0
+    while True:
+        query = Post.query.filter(Post.id > last_id)
+        if missing_only:
+            query = query.filter(Post.deleted_at.is_(None), search_index.unindexed())
+        posts = query.order_by(Post.id).limit(batch_size).all()
+        if not posts:
+            return indexed
+
+        for post in posts:
+            if post.deleted_at is None:
+                search_index.index_post(post)
+                indexed += 1
+            else:
+                search_index.remove_post(post.id)
+        db.session.commit()
+        last_id = posts[-1].id
+
+
+def reconcile_post_counters_service():
+    views = db.session.query(func.count(UserActions.id)) \
+        .filter(UserActions.post_id == Post.id).scalar_subquery()
+    likes = db.session.query(func.count(UserActions.id)) \
+        .filter(UserActions.post_id == Post.id, UserActions.is_liked == True).scalar_subquery()
+
+    updated = Post.query.filter(or_(Post.views_count != views, Post.likes_count != likes)) \
+        .update({Post.views_count: views, Post.likes_count: likes}, synchronize_session=False)
+    db.session.commit()
+    return updated
+
+
+def reset_image_processing_service():
+    # Очередь обработки живёт в памяти процесса: после перезапуска незавершённые пакеты потеряны.
+    updated = Post.query.filter(Post.pending_images > 0) \
+        .update({Post.pending_images: 0, Post.processing_status: 'failed'}, synchronize_session=False)
+    db.session.commit()
+    return updated
+
+
+def dedupe_user_actions_service():
+    keep_ids = db.session.query(func.min(UserActions.id)) \
+        .group_by(UserActions.post_id, UserActions.finger_print)
+    removed = db.session.query(UserActions).filter(UserActions.id.not_in(keep_ids.scalar_subquery())) \
+        .delete(synchronize_session=False)
+    db.session.commit()
+    return removed
+
+
 def remove_tag_from_all_posts_service(tag_id):
     try:
+        bump_post_versions(db.session.query(TagInPost.post_id).filter(TagInPost.tag_id == tag_id).scalar_subquery())
         TagInPost.query.filter(TagInPost.tag_id == tag_id).delete(synchronize_session=False)
         db.session.commit()
+        tag_cache.invalidate(int(tag_id))
         return 1
     except Exception as e:
         db.session.rollback()
         return 0
 
 
-def search_posts_service(query, date_filter_type=None, tags_filter=None, start_date=None, end_date=None):
+def update_tag_name_service(tag_id, tag_name):
+    """Переименовывает тег во всех постах одним UPDATE. Возвращает число обновлённых строк.
+
+    Имена тегов хранятся в TagInPost.tag_name, поэтому списки и карточки постов не
+    обращаются к tag-api; tag-api сообщает о переименовании этим вызовом.
+    """
+    tag_name = (tag_name or '').strip()
+    if not tag_name:
+        raise ValueError('Пустое название тега')
+    if len(tag_name) > TagInPost.tag_name.type.length:
+        raise ValueError('Слишком длинное название тега')
+
+    stale = and_(TagInPost.tag_id == tag_id, TagInPost.tag_name != tag_name)
+    try:
+        bump_post_versions(db.session.query(TagInPost.post_id).filter(stale).scalar_subquery())
+        updated = db.session.execute(
+            update(TagInPost).where(stale).values(tag_name=tag_name),
+            execution_options={'synchronize_session': False}
+        ).rowcount
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    tag_cache.set(int(tag_id), {'id': str(tag_id), 'name': tag_name})
+    return updated
+
+
+def search_posts_service(query, date_filter_type=None, tags_filter=None, start_date=None, end_date=None,
+                         cursor=None, limit=None):
     try:
         if not query:
-            return []
+            return {'posts': [], 'next_cursor': None}
 
         query_filter = and_(
             Post.is_approved == True,
             Post.deleted_at.is_(None)
         )
 
-        if query:
-            search_conditions = []
-            words = query.split()
-
-            for word in words:
-                search_conditions.append(Post.header.ilike(f"%{word}%"))
-                search_conditions.append(Post.lead.ilike(f"%{word}%"))
-                search_conditions.append(Post.reviewer.ilike(f"%{word}%"))
-
-                search_conditions.append(
-                    exists().where(and_(
-                        TextInPost.post_id == Post.id,
-                        TextInPost.deleted_at.is_(None),
-                        TextInPost.text.ilike(f"%{word}%")
-                    ))
-                )
-
-                search_conditions.append(
-                    exists().where(and_(
-                        ImageInPost.post_id == Post.id,
-                        ImageInPost.deleted_at.is_(None),
-                        or_(
-                            ImageInPost.description.ilike(f"%{word}%"),
-                            ImageInPost.address.ilike(f"%{word}%")
-                        )
-                    ))
-                )
-
-            query_filter = and_(
-                query_filter,
-                or_(*search_conditions)
-            )
-
         if tags_filter:
             query_filter &= exists().where(and_(
                 TagInPost.post_id == Post.id,
@@ -498,15 +806,35 @@ def search_posts_service(query, date_filter_type=None, tags_filter=None, start_d
                 TagInPost.tag_id.in_(tags_filter)
             ))
 
-        if start_date or end_date:
-            date_field = Post.created_at if date_filter_type == "creation" else Post.date_range
+        if date_filter_type == "creation":
             if start_date:
-                query_filter &= (date_field >= start_date)
+                query_filter &= (Post.created_at >= start_date)
             if end_date:
-                query_filter &= (date_field <= end_date)
-
-        posts = Post.query.filter(query_filter).all()
-        return [get_post_by_address_service(post.address) for post in posts]
+                query_filter &= (Post.created_at <= end_date)
+        else:
+            filter_start = parse_history_date(start_date)
+            filter_end = parse_history_date(end_date, is_end=True)
+            if filter_start:
+                query_filter &= (Post.history_end >= filter_start)
+            if filter_end:
+                query_filter &= (Post.history_start <= filter_end)
+
+        matches = get_search_index().match(query)
+        if matches is None:
+            return {'posts': [], 'next_cursor': None}
+
+        order = (matches.c.score, Post.id)
+        rows, next_cursor = _paginate(
+            db.session.query(*order).join(matches, matches.c.post_id == Post.id).filter(query_filter),
+            order,
+            cursor,
+            _normalize_page_size(limit),
+            descending=True
+        )
+        return {
+            'posts': get_posts_by_ids_service([row.id for row in rows]),
+            'next_cursor': next_cursor
+        }
 
     except Exception as e:
         print(f"Ошибка поиска постов: {e}")
@@ -518,57 +846,7 @@ def get_search_suggestions_service(query, limit=5):
         return []
 
     try:
-        query_lower = query.lower()
-        suggestions = set()
-
-        header_posts = Post.query.filter(
-            Post.header.ilike(f"%{query}%"),
-            Post.is_approved == True,
-            Post.deleted_at.is_(None)
-        ).all()
-        suggestions.update(post.header for post in header_posts)
-
-        lead_posts = Post.query.filter(
-            Post.lead.ilike(f"%{query}%"),
-            Post.is_approved == True,
-            Post.deleted_at.is_(None)
-        ).all()
-        suggestions.update(post.header for post in lead_posts)
-
-        reviewer_posts = Post.query.filter(
-            Post.reviewer.ilike(f"%{query}%"),
-            Post.is_approved == True,
-            Post.deleted_at.is_(None)
-        ).all()
-        suggestions.update(post.header for post in reviewer_posts)
-
-        matched_texts = TextInPost.query.filter(
-            TextInPost.text.ilike(f"%{query}%"),
-            TextInPost.deleted_at.is_(None)
-        ).all()
-
-        post_ids = {text.post_id for text in matched_texts}
-
-        if post_ids:
-            text_posts = Post.query.filter(
-                Post.id.in_(post_ids),
-                Post.is_approved == True,
-                Post.deleted_at.is_(None)
-            ).all()
-            suggestions.update(post.header for post in text_posts)
-
-        sorted_suggestions = sorted(
-            suggestions,
-            key=lambda x: (
-                x.lower().startswith(query_lower),
-                -x.lower().count(query_lower),
-                len(x)
-            ),
-            reverse=True
-        )
-
-        return list(sorted_suggestions)[:limit]
-
+        return suggestion_index.suggest(query, limit)
     except Exception as e:
         print(f"Ошибка при получении подсказок: {e}")
         return []
@@ -590,44 +868,182 @@ def get_user_posts_service(user_id):
     return result
 
 
+def get_creator_post_summaries_service(creator_id, cursor=None, limit=None):
+    query = db.session.query(*CREATION_ORDER).filter(
+        Post.creator_id == creator_id,
+        Post.is_approved == True,
+        Post.deleted_at.is_(None)
+    )
+    rows, next_cursor = _paginate(query, CREATION_ORDER, cursor, _normalize_page_size(limit), descending=True)
+    return get_posts_by_ids_service([row.id for row in rows], detail=False), next_cursor
+
+
+def count_posts_by_tag_service(tag_ids):
+    """Число одобренных неудалённых постов по каждому тегу; для тегов без постов — 0."""
+    tag_ids = list(dict.fromkeys(tag_ids))
+    if not tag_ids:
+        return {}
+
+    rows = db.session.query(TagInPost.tag_id, db.func.count(db.distinct(TagInPost.post_id))) \
+        .join(Post, Post.id == TagInPost.post_id) \
+        .filter(
+            TagInPost.tag_id.in_(tag_ids),
+            TagInPost.deleted_at.is_(None),
+            Post.is_approved == True,
+            Post.deleted_at.is_(None)
+        ) \
+        .group_by(TagInPost.tag_id).all()
+
+    counts = dict.fromkeys(tag_ids, 0)
+    counts.update(rows)
+    return counts
+
+
+def iter_post_batches_for_export(after_id=0, include_unapproved=False, batch_size=500):
+    """Отдаёт пачками посты с id > after_id по возрастанию id.
+
+    Посты читаются серверным курсором (yield_per), дочерние строки подгружаются
+    selectinload на каждую пачку, авторы — одним вызовом на пачку; в памяти
+    одновременно находится не больше batch_size постов.
+    """
+    statement = select(Post).options(*_post_detail_options()) \
+        .filter(Post.id > after_id, Post.deleted_at.is_(None)) \
+        .order_by(Post.id) \
+        .execution_options(yield_per=batch_size)
+    if not include_unapproved:
+        statement = statement.filter(Post.is_approved == True)
+
+    for posts in db.session.execute(statement).scalars().partitions():
+        users = get_users_by_ids(post.creator_id for post in posts)
+        yield [_serialize_post_detail(post, users) for post in posts]
+
+
 def add_like_to_post_service(post_address, finger_print):
-    post = get_post_by_address_service(post_address)
-    action = UserActions.query.filter(UserActions.finger_print == finger_print, UserActions.post_id == post.get('id')).first()
-    action.is_liked = not action.is_liked
-    db.session.commit()
+    post_id = _get_post_id_by_address(post_address)
+    if not post_id:
+        raise ValueError('Пост не найден')
 
+    try:
+        view_recorder.discard(finger_print, post_id)
+        is_liked = db.session.execute(
+            update(UserActions)
+            .where(UserActions.post_id == post_id, UserActions.finger_print == finger_print)
+            .values(is_liked=~UserActions.is_liked)
+            .returning(UserActions.is_liked)
+        ).scalar()
+
+        views_delta = 0
+        if is_liked is None:
+            statement = dialect_insert(UserActions).values(
+                post_id=post_id,
+                finger_print=finger_print,
+                is_liked=True,
+                created_at=datetime.now()
+            )
+            statement = statement.on_conflict_do_update(
+                index_elements=[UserActions.post_id, UserActions.finger_print],
+                set_={'is_liked': ~UserActions.__table__.c.is_liked}
+            ).returning(UserActions.is_liked)
+            is_liked = db.session.execute(statement).scalar()
+            views_delta = 1
+
+        likes, views = db.session.execute(
+            update(Post)
+            .where(Post.id == post_id)
+            .values(likes_count=Post.likes_count + (1 if is_liked else -1),
+                    views_count=Post.views_count + views_delta)
+            .returning(Post.likes_count, Post.views_count)
+        ).one()
+        db.session.commit()
 
-def _add_view_to_post(finger_print, post_id):
-    action = UserActions(finger_print=finger_print,
-                          is_liked=False,
-                          post_id=post_id)
-    db.session.add(action)
-    db.session.commit()
+        return {'is_liked': is_liked, 'likes': likes, 'views': views}
+    except Exception as e:
+        db.session.rollback()
+        raise e
 
-    return action
 
+def _reserve_post_image(image_jobs, image, known_images=()):
+    # Пустое изображение сохраняется как отсутствующее, как и до переноса обработки в фон.
+    if not image:
+        return None
+    return image if image in known_images else image_processor.reserve(image_jobs, image)
+
+
+def _collect_content(content, image_jobs, known_images=()):
+    """Разбирает блоки контента в structure и значения строк TextInPost/ImageInPost/VideoInPost по порядку.
 
-def _add_content_to_post(post_id, content, post_address, structure):
+    Изображения из known_images (уже привязанные к посту, возможно ещё в обработке) не загружаются повторно.
+    """
+    structure, texts, images, videos = [], [], [], []
     for item in content:
         if item['type'] == 'image':
-            image_path = save_image(item['src'], post_address, 'image')
-            image_in_post = ImageInPost(post_id=post_id, address=image_path, description=item.get('description', ''))
-            db.session.add(image_in_post)
-            structure.append({'type': 'image', 'src': image_path, 'description': item.get('description', '')})
+            image_path = _reserve_post_image(image_jobs, item.get('src'), known_images)
+            description = item.get('description', '')
+            images.append({'address': image_path, 'description': description})
+            structure.append({'type': 'image', 'src': image_path, 'description': description})
         elif item['type'] == 'video':
-            video_in_post = VideoInPost(post_id=post_id, address=item['src'])
-            db.session.add(video_in_post)
+            videos.append({'address': item['src']})
             structure.append({'type': 'video', 'src': item['src']})
         elif item['type'] == 'text':
-            text_in_post = TextInPost(post_id=post_id, text=item.get('value', ''))
-            db.session.add(text_in_post)
+            texts.append({'text': item.get('value', '')})
             structure.append({'type': 'text', 'text': item.get('value', '')})
+    return structure, texts, images, videos
+
+
+def _insert_child_rows(model, post_id, rows):
+    """Один INSERT на все строки (executemany / multi-values), без загрузки объектов в сессию.
+
+    Возвращает True, если что-то вставлено: такие строки не попадают в session.new.
+    """
+    if not rows:
+        return False
+    db.session.execute(insert(model), [dict(values, post_id=post_id) for values in rows])
+    return True
+
+
+def _sync_child_rows(model, post_id, wanted):
+    """Приводит строки блоков поста к списку wanted, сопоставляя их по позиции.
+
+    Совпадающие строки не трогаются, отличающиеся обновляются на месте,
+    лишние удаляются, недостающие добавляются. Возвращает True, если строки были добавлены.
+    """
+    existing = model.query.filter(model.post_id == post_id, model.deleted_at.is_(None)).order_by(model.id).all()
+
+    for row, values in zip(existing, wanted):
+        for key, value in values.items():
+            if getattr(row, key) != value:
+                setattr(row, key, value)
+    for row in existing[len(wanted):]:
+        db.session.delete(row)
+    return _insert_child_rows(model, post_id, wanted[len(existing):])
+
+
+def _sync_post_tags(post_id, tag_ids):
+    wanted = list(dict.fromkeys(int(tag_id) for tag_id in tag_ids))
+    existing = {
+        tag.tag_id: tag for tag in
+        TagInPost.query.filter(TagInPost.post_id == post_id, TagInPost.deleted_at.is_(None)).all()
+    }
+
+    for tag_id, tag_in_post in existing.items():
+        if tag_id not in wanted:
+            db.session.delete(tag_in_post)
+    return _add_tags_to_post(post_id, [tag_id for tag_id in wanted if tag_id not in existing])
+
+
+def _session_has_changes():
+    return bool(db.session.new or db.session.deleted) or \
+        any(db.session.is_modified(obj) for obj in db.session.dirty)
+
+
+def _tag_rows(tag_ids):
+    # Имя записывается в TagInPost навсегда, поэтому берётся из tag-api, а не из кэша воркера.
+    tags = get_tags_by_ids(tag_ids, fresh=True)
+    return [
+        {'tag_id': tag_id, 'tag_name': tags[tag_id]['name']}
+        for tag_id in dict.fromkeys(int(tag_id) for tag_id in tag_ids) if tag_id in tags
+    ]
 
 
-def _add_tags_to_post(post_id, tags):
-    for tag_id in tags:
-        tag = get_tag_by_id(tag_id)
-        if tag:
-            print(post_id)
-            tag_in_post = TagInPost(post_id=post_id, tag_id=tag_id, tag_name=tag['name'])
-            db.session.add(tag_in_post)
+def _add_tags_to_post(post_id, tag_ids):
+    return _insert_child_rows(TagInPost, post_id, _tag_rows(tag_ids))
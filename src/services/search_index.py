@@ -0,0 +1,150 @@
+import re
+
+from sqlalchemy import text, func, cast, select, literal_column, Double, exists
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from ..db import db
+from ..models import Post, PostSearchDocument, TextInPost, ImageInPost
+
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+# Окончания для лёгкого стемминга запросов в SQLite (в Postgres работает словарь russian).
+_RUSSIAN_ENDINGS = sorted((
+    'иями', 'ями', 'ами', 'ого', 'его', 'ому', 'ему', 'ыми', 'ими', 'ией', 'иях', 'ях', 'ах',
+    'ов', 'ев', 'ей', 'ий', 'ый', 'ой', 'ая', 'яя', 'ое', 'ее', 'ие', 'ые', 'ую', 'юю', 'ом', 'ем',
+    'ам', 'ям', 'ию', 'ия', 'ть', 'ла', 'ли', 'ло', 'а', 'я', 'о', 'е', 'и', 'ы', 'у', 'ю', 'ь'
+), key=len, reverse=True)
+
+
+def _query_words(query):
+    return [word.lower() for word in _WORD_RE.findall(query or '')]
+
+
+def _stem(word):
+    for ending in _RUSSIAN_ENDINGS:
+        if word.endswith(ending) and len(word) - len(ending) >= 3:
+            return word[:-len(ending)]
+    return word
+
+
+def build_search_document(post):
+    texts = db.session.query(TextInPost.text).filter(
+        TextInPost.post_id == post.id,
+        TextInPost.deleted_at.is_(None)
+    ).all()
+    descriptions = db.session.query(ImageInPost.description).filter(
+        ImageInPost.post_id == post.id,
+        ImageInPost.deleted_at.is_(None)
+    ).all()
+
+    body = [post.reviewer or '']
+    body.extend(row[0] or '' for row in texts)
+    body.extend(row[0] or '' for row in descriptions)
+
+    return {
+        'header': post.header or '',
+        'lead': post.lead or '',
+        'body': '\n'.join(part for part in body if part)
+    }
+
+
+class PostgresSearchIndex:
+    config = 'russian'
+
+    def _vector(self, header, lead, body):
+        return (
+            func.setweight(func.to_tsvector(self.config, header), 'A')
+            .op('||')(func.setweight(func.to_tsvector(self.config, lead), 'B'))
+            .op('||')(func.setweight(func.to_tsvector(self.config, body), 'C'))
+        )
+
+    def index_post(self, post):
+        document = build_search_document(post)
+        statement = pg_insert(PostSearchDocument).values(
+            post_id=post.id,
+            search_vector=self._vector(document['header'], document['lead'], document['body']),
+            **document
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[PostSearchDocument.post_id],
+            set_={
+                'header': statement.excluded.header,
+                'lead': statement.excluded.lead,
+                'body': statement.excluded.body,
+                'search_vector': statement.excluded.search_vector
+            }
+        )
+        db.session.execute(statement)
+
+    def remove_post(self, post_id):
+        db.session.execute(PostSearchDocument.__table__.delete().where(PostSearchDocument.post_id == post_id))
+
+    def unindexed(self):
+        return ~exists().where(PostSearchDocument.post_id == Post.id)
+
+    def match(self, query):
+        words = _query_words(query)
+        if not words:
+            return None
+
+        ts_query = func.to_tsquery(self.config, ' | '.join(f'{word}:*' for word in words))
+        score = cast(func.ts_rank_cd(PostSearchDocument.search_vector, ts_query, 32), Double)
+        return select(PostSearchDocument.post_id, score.label('score')).where(
+            PostSearchDocument.search_vector.op('@@')(ts_query)
+        ).subquery()
+
+
+class SqliteSearchIndex:
+    table = 'post_search_fts'
+
+    def __init__(self):
+        self._schema_ready = False
+
+    def _ensure_schema(self):
+        if not self._schema_ready:
+            db.session.execute(text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} "
+                "USING fts5(header, lead, body, tokenize='unicode61 remove_diacritics 2')"
+            ))
+            self._schema_ready = True
+
+    def index_post(self, post):
+        self._ensure_schema()
+        self.remove_post(post.id)
+        db.session.execute(
+            text(f"INSERT INTO {self.table} (rowid, header, lead, body) VALUES (:post_id, :header, :lead, :body)"),
+            {'post_id': post.id, **build_search_document(post)}
+        )
+
+    def remove_post(self, post_id):
+        self._ensure_schema()
+        db.session.execute(text(f"DELETE FROM {self.table} WHERE rowid = :post_id"), {'post_id': post_id})
+
+    def unindexed(self):
+        self._ensure_schema()
+        return Post.id.notin_(select(literal_column('rowid')).select_from(text(self.table)))
+
+    def match(self, query):
+        words = _query_words(query)
+        if not words:
+            return None
+
+        self._ensure_schema()
+        fts_query = ' OR '.join(f'"{_stem(word)}"*' for word in words)
+        # bm25() тем меньше, чем релевантнее документ; веса колонок: заголовок, лид, тело.
+        return select(
+            literal_column('rowid').label('post_id'),
+            cast(-func.bm25(literal_column(self.table), 10.0, 4.0, 1.0), Double).label('score')
+        ).select_from(text(self.table)).where(
+            literal_column(self.table).op('MATCH')(fts_query)
+        ).subquery()
+
+
+_indexes = {}
+
+
+def get_search_index():
+    dialect = db.engine.dialect.name
+    if dialect not in _indexes:
+        _indexes[dialect] = PostgresSearchIndex() if dialect == 'postgresql' else SqliteSearchIndex()
+    return _indexes[dialect]
@@ -0,0 +1,155 @@
+import os
+import re
+import threading
+import time
+from bisect import bisect_left, insort
+
+from ..db import db
+from ..models import Post
+
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def normalize(value):
+    return ' '.join(_WORD_RE.findall((value or '').lower().replace('ё', 'е')))
+
+
+class SuggestionIndex:
+    """Префиксный индекс подсказок по заголовкам одобренных постов.
+
+    Хранит отсортированный список (термин, post_id), где термины — заголовок целиком
+    и все его хвосты, начинающиеся с очередного слова. Поиск — bisect по префиксу,
+    поэтому подсказки не обращаются к базе. Индекс обновляется точечно при одобрении,
+    редактировании и удалении постов и целиком перестраивается фоновым потоком раз в ttl
+    секунд, чтобы подтягивать изменения, сделанные другими процессами. Пока первая сборка
+    не закончилась, подсказок нет.
+    """
+
+    def __init__(self, ttl=300, max_scan=5000, max_cached_results=1024, app=None):
+        self.app = None
+        self.ttl = ttl
+        self.max_scan = max_scan
+        self.max_cached_results = max_cached_results
+        self._lock = threading.Lock()
+        self._entries = []
+        self._posts = {}
+        self._results = {}
+        self._built_at = None
+        self._thread = None
+        self._pid = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+
+    @staticmethod
+    def _terms(header):
+        words = normalize(header).split()
+        return {' '.join(words[i:]) for i in range(len(words))}
+
+    def _add(self, post_id, header, weight):
+        terms = self._terms(header)
+        self._posts[post_id] = (header, weight, terms, normalize(header))
+        for term in terms:
+            insort(self._entries, (term, post_id))
+
+    def _remove(self, post_id):
+        _, _, terms, _ = self._posts.pop(post_id, (None, 0, (), None))
+        for term in terms:
+            index = bisect_left(self._entries, (term, post_id))
+            if index < len(self._entries) and self._entries[index] == (term, post_id):
+                del self._entries[index]
+
+    def rebuild(self):
+        rows = db.session.query(Post.id, Post.header, Post.views_count) \
+            .filter(Post.is_approved == True, Post.deleted_at.is_(None)).all()
+
+        posts = {}
+        entries = []
+        for post_id, header, views in rows:
+            terms = self._terms(header)
+            posts[post_id] = (header, views, terms, normalize(header))
+            entries.extend((term, post_id) for term in terms)
+        entries.sort()
+
+        with self._lock:
+            self._entries = entries
+            self._posts = posts
+            self._results = {}
+            self._built_at = time.monotonic()
+
+    def _ensure_worker(self):
+        # Поток запускается лениво и заново после fork, чтобы каждый воркер имел свой.
+        # Без app индекс обновляется только явными вызовами rebuild().
+        if self.app is None:
+            return
+        if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name='suggestion-index', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            try:
+                with self.app.app_context():
+                    self.rebuild()
+                    db.session.remove()
+            except Exception as e:
+                print(f"Ошибка перестроения индекса подсказок: {e}")
+            time.sleep(self.ttl)
+
+    def upsert(self, post_id, header, weight=None):
+        if self._built_at is None:
+            return
+
+        with self._lock:
+            if weight is None:
+                weight = self._posts.get(post_id, (None, 0, (), None))[1]
+            self._remove(post_id)
+            self._add(post_id, header, weight)
+            self._results = {}
+
+    def remove(self, post_id):
+        if self._built_at is None:
+            return
+
+        with self._lock:
+            self._remove(post_id)
+            self._results = {}
+
+    def suggest(self, query, limit=5):
+        self._ensure_worker()
+        prefix = normalize(query)
+        if not prefix:
+            return []
+
+        with self._lock:
+            cached = self._results.get((prefix, limit))
+            if cached is not None:
+                return cached
+
+            matches = {}
+            index = bisect_left(self._entries, (prefix,))
+            end = min(len(self._entries), index + self.max_scan)
+            while index < end and self._entries[index][0].startswith(prefix):
+                post_id = self._entries[index][1]
+                header, weight, _, normalized = self._posts[post_id]
+                is_head = normalized.startswith(prefix)
+                matches[header] = max(matches.get(header, (False, 0)), (is_head, weight))
+                index += 1
+
+            result = sorted(matches, key=lambda header: (not matches[header][0], -matches[header][1], len(header)))
+            result = result[:limit]
+            if len(self._results) >= self.max_cached_results:
+                self._results = {}
+            self._results[(prefix, limit)] = result
+            return result
+
+    def stats(self):
+        with self._lock:
+            return {
+                'posts': len(self._posts),
+                'terms': len(self._entries),
+                'age': time.monotonic() - self._built_at if self._built_at is not None else None
+            }
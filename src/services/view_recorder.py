@@ -0,0 +1,137 @@
+import atexit
+import os
+import threading
+from collections import Counter
+from datetime import datetime
+
+from sqlalchemy import update, bindparam
+
+from ..db import db
+from ..models import Post, UserActions
+from ..utils.db_utils import dialect_insert
+
+
+class ViewRecorder:
+    """Отложенная запись просмотров постов.
+
+    GET-запрос только кладёт пару (fingerprint, post_id) в очередь в памяти;
+    фоновый поток раз в flush_interval секунд (или при накоплении batch_size пар)
+    вставляет их многострочной вставкой с ON CONFLICT DO NOTHING по уникальному
+    индексу (post_id, finger_print) и увеличивает views_count на число реально
+    вставленных строк.
+    Очередь ограничена max_pending: при переполнении запись делается синхронно
+    в потоке запроса. При завершении процесса очередь сбрасывается в базу.
+    """
+
+    def __init__(self, app=None):
+        self.app = None
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._pid = None
+        self.flushed = 0
+        self.failed_flushes = 0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        self.flush_interval = app.config.get('VIEW_FLUSH_INTERVAL', 2)
+        self.batch_size = app.config.get('VIEW_FLUSH_BATCH_SIZE', 500)
+        self.max_pending = app.config.get('VIEW_QUEUE_MAX', 10000)
+        atexit.register(self.flush)
+
+    @property
+    def queue_depth(self):
+        return len(self._pending)
+
+    def _ensure_worker(self):
+        # Поток запускается лениво и заново после fork, чтобы каждый воркер имел свой.
+        if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name='view-recorder', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def record(self, finger_print, post_id):
+        with self._lock:
+            self._pending.add((finger_print, post_id))
+            depth = len(self._pending)
+
+        if not self.flush_interval or depth >= self.max_pending:
+            self.flush()
+            return
+
+        self._ensure_worker()
+        if depth >= self.batch_size:
+            self._wakeup.set()
+
+    def is_pending(self, finger_print, post_id):
+        return (finger_print, post_id) in self._pending
+
+    def discard(self, finger_print, post_id):
+        with self._lock:
+            self._pending.discard((finger_print, post_id))
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, set()
+            if not batch:
+                return 0
+
+            try:
+                with self.app.app_context():
+                    written = self._write(batch)
+                self.flushed += written
+                return written
+            except Exception as e:
+                self.failed_flushes += 1
+                print(f"Ошибка записи просмотров: {e}")
+                with self._lock:
+                    if len(self._pending) + len(batch) <= self.max_pending:
+                        self._pending |= batch
+                return 0
+
+    def _write(self, batch, chunk_size=1000):
+        now = datetime.now()
+        rows = [
+            {'finger_print': finger_print, 'post_id': post_id, 'is_liked': False, 'created_at': now}
+            for finger_print, post_id in batch
+        ]
+
+        views = Counter()
+        for start in range(0, len(rows), chunk_size):
+            statement = dialect_insert(UserActions).values(rows[start:start + chunk_size])
+            statement = statement.on_conflict_do_nothing(
+                index_elements=[UserActions.post_id, UserActions.finger_print]
+            ).returning(UserActions.post_id)
+            views.update(db.session.execute(statement).scalars())
+
+        if views:
+            db.session.execute(
+                update(Post.__table__)
+                .where(Post.__table__.c.id == bindparam('post_id'))
+                .values(views_count=Post.__table__.c.views_count + bindparam('views')),
+                [{'post_id': post_id, 'views': count} for post_id, count in views.items()]
+            )
+        db.session.commit()
+        return sum(views.values())
+
+    def stats(self):
+        return {
+            'depth': self.queue_depth,
+            'max_depth': self.max_pending,
+            'flushed': self.flushed,
+            'failed_flushes': self.failed_flushes
+        }
+
+
+view_recorder = ViewRecorder()
@@ -0,0 +1,10 @@
+from sqlalchemy.dialects import postgresql, sqlite
+
+from ..db import db
+
+
+def dialect_insert(model):
+    """INSERT с поддержкой ON CONFLICT для текущего диалекта (PostgreSQL или SQLite)."""
+    if db.engine.dialect.name == 'postgresql':
+        return postgresql.insert(model)
+    return sqlite.insert(model)
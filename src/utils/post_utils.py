@@ -11,69 +11,144 @@ import re
 from io import BytesIO
 from PIL import Image, ImageDraw, ImageFont
 import json
-from datetime import datetime
+from datetime import datetime, date
+
+from .storage import asset_storage
 
 def generate_post_address(header):
     address = translit(header, reversed=True).lower().replace(' ', '_')
     return address
 
 
-def get_next_filename(folder, extension):
-    if not os.path.exists(folder):
-        os.makedirs(folder)
-        return f'1.{extension}'
+def enhance_and_resize(img, target_width=1920, target_height=1080):
+    # Вписываем в target_width x target_height с сохранением пропорций и без увеличения.
+    height, width = img.shape[:2]
+    scale = min(target_width / width, target_height / height)
+    if scale >= 1:
+        return img
 
-    existing_files = [f for f in os.listdir(folder) if f.endswith(f".{extension}")]
-    numbers = []
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return cv2.resize(img, size, interpolation=cv2.INTER_AREA)
 
-    for file in existing_files:
-        try:
-            num = int(file.split('.')[0])
-            numbers.append(num)
-        except ValueError:
-            continue
 
-    next_number = max(numbers, default=0) + 1
-    return f'{next_number}.{extension}'
+_VARIANT_RE = re.compile(r'^(?P<stem>.+)\.w(?P<width>\d+)\.(?P<extension>\w+)$')
+WEBP_QUALITY = 80
 
-def enhance_and_resize(img, target_width=1920, target_height=1080):
 
-    img = cv2.resize(img, (target_width, target_height), interpolation=cv2.INTER_LANCZOS4)
+def variant_path(image_path, width=None, extension=None):
+    """Путь варианта изображения: 1.png -> 1.w640.png, 1.webp, 1.w640.webp."""
+    stem, original_extension = os.path.splitext(image_path)
+    extension = extension or original_extension.lstrip('.')
+    return f'{stem}.w{width}.{extension}' if width else f'{stem}.{extension}'
 
-    return img
 
+def parse_variant_path(image_path):
+    """Обратное к variant_path: возвращает (исходный путь без расширения, ширина, расширение)."""
+    match = _VARIANT_RE.match(image_path)
+    if match:
+        return match.group('stem'), int(match.group('width')), match.group('extension')
+    stem, extension = os.path.splitext(image_path)
+    return stem, None, extension.lstrip('.')
 
-def save_image(image, post_address, image_type):
-    try:
-        image_folder = f'src/assets/{post_address}/{image_type}'
-        os.makedirs(image_folder, exist_ok=True)
 
-        image_format = image.split(";")[0].split("/")[1]
-        base64_data = image.split(",")[1]
-        image_data = base64.b64decode(base64_data)
+def image_variants(image_path, widths):
+    if not image_path:
+        return []
+    return [
+        {'width': width, 'src': variant_path(image_path, width), 'webp': variant_path(image_path, width, 'webp')}
+        for width in widths
+    ]
+
 
-        np_arr = np.frombuffer(image_data, np.uint8)
-        img = cv2.imdecode(np_arr, cv2.IMREAD_COLOR)
+def _write_image(storage, image_path, img):
+    extension = os.path.splitext(image_path)[1]
+    params = [cv2.IMWRITE_WEBP_QUALITY, WEBP_QUALITY] if extension == '.webp' else []
+    success, buffer = cv2.imencode(extension, img, params)
+    if not success:
+        raise ValueError(f"Не удалось записать изображение: {image_path}")
+    storage.save(image_path, buffer.tobytes())
 
-        if img is None:
-            raise ValueError("Ошибка декодирования изображения")
 
-        img = enhance_and_resize(img)
+def write_image_variants(storage, img, image_path, widths, write_original=True):
+    """Пишет уменьшенные копии (только меньше исходной ширины) и WebP-версии изображения.
+
+    Основной файл image_path пишется последним, поэтому его появление означает,
+    что все варианты уже готовы.
+    """
+    height, width = img.shape[:2]
+    for variant_width in sorted(widths):
+        if variant_width >= width:
+            continue
+        size = (variant_width, max(1, round(height * variant_width / width)))
+        resized = cv2.resize(img, size, interpolation=cv2.INTER_AREA)
+        _write_image(storage, variant_path(image_path, variant_width), resized)
+        _write_image(storage, variant_path(image_path, variant_width, 'webp'), resized)
+
+    if not image_path.endswith('.webp'):
+        _write_image(storage, variant_path(image_path, extension='webp'), img)
+    if write_original:
+        _write_image(storage, image_path, img)
+
+
+def build_missing_variants(storage, widths):
+    """Создаёт варианты для изображений, загруженных до их появления. Возвращает число файлов."""
+    built = 0
+    for folder, _, filenames in os.walk(storage.root):
+        for filename in filenames:
+            stem, width, extension = parse_variant_path(filename)
+            if width or extension.lower() not in ('png', 'jpg', 'jpeg'):
+                continue
+
+            image_path = storage.public_prefix + os.path.relpath(os.path.join(folder, filename), storage.root)
+            if storage.exists(variant_path(image_path, extension='webp')):
+                continue
+
+            img = cv2.imread(storage.local_path(image_path), cv2.IMREAD_COLOR)
+            if img is None:
+                continue
+            write_image_variants(storage, img, image_path, widths, write_original=False)
+            built += 1
+    return built
+
+
+def prepare_image_upload(image, storage=asset_storage):
+    """Возвращает (исходник, путь в хранилище по хэшу содержимого) для изображения поста.
+
+    image — asset id файла, загруженного через /post/upload (исходником будет путь к нему),
+    либо data URL в base64 (исходником будут декодированные байты).
+    """
+    if not str(image).startswith('data:'):
+        key, image_format = storage.parse_asset_id(image)
+        if not storage.upload_exists(key, image_format):
+            raise ValueError(f'Файл не найден: {image}')
+        return storage.upload_path(key, image_format), storage.path_for(key, image_format)
+
+    try:
+        image_format = image.split(";")[0].split("/")[1]
+        image_data = base64.b64decode(image.split(",")[1])
+    except (AttributeError, IndexError, ValueError):
+        raise ValueError("Ошибка декодирования изображения")
+
+    if not allowed_file(f'image.{image_format}'):
+        raise ValueError(f'Недопустимый формат изображения: {image_format}')
 
-        filename = get_next_filename(image_folder, image_format)
-        image_path = os.path.join(image_folder, filename)
+    return image_data, storage.path_for(storage.content_key(image_data), image_format)
 
-        if not allowed_file(filename):
-            raise ValueError(f'Недопустимое расширение файла: {filename}')
 
-        cv2.imwrite(image_path, img)
-        print(f"Изображение сохранено: {image_path}")
+def process_image(storage, source, image_path, widths=()):
+    """Декодирует изображение, масштабирует и записывает в хранилище вместе с вариантами ширины widths.
 
-        return image_path
+    source — байты изображения или путь к загруженному файлу. Не использует контекст
+    приложения, поэтому может выполняться в отдельном процессе.
+    """
+    np_arr = np.frombuffer(source, np.uint8) if isinstance(source, bytes) else np.fromfile(source, np.uint8)
+    img = cv2.imdecode(np_arr, cv2.IMREAD_COLOR)
 
-    except Exception as e:
-        print(f"Ошибка при обработке изображения: {e}")
+    if img is None:
+        raise ValueError("Ошибка декодирования изображения")
 
+    write_image_variants(storage, enhance_and_resize(img), image_path, widths)
+    return image_path
 
 
 def allowed_file(filename):
@@ -111,38 +186,58 @@ def highlight_match(text, query, max_len=80):
     return snippet
 
 
-def parse_post_dates(post):
+def encode_cursor(*values):
+    payload = json.dumps(values, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
     try:
-        if not post.date_range:
-            return None, None
-
-        date_data = json.loads(post.date_range)
-        start_date_str = str(date_data.get('start_date', '')) if date_data.get('start_date') else ''
-        end_date_str = str(date_data.get('end_date', '')) if date_data.get('end_date') else ''
-
-        post_start = None
-        if start_date_str:
-            if len(start_date_str) == 4 and start_date_str.isdigit():
-                post_start = datetime(int(start_date_str), 1, 1).date()
-            else:
-                try:
-                    post_start = datetime.strptime(start_date_str, "%Y-%m-%d").date()
-                except ValueError:
-                    pass
-
-        post_end = None
-        if end_date_str:
-            if len(end_date_str) == 4 and end_date_str.isdigit():
-                post_end = datetime(int(end_date_str), 12, 31).date()
-            else:
-                try:
-                    post_end = datetime.strptime(end_date_str, "%Y-%m-%d").date()
-                except ValueError:
-                    pass
-
-        return post_start, post_end
-    except:
-        return None, None
+        payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(payload)
+    except (ValueError, TypeError):
+        raise ValueError('Некорректный курсор')
+
+    if not isinstance(values, list):
+        raise ValueError('Некорректный курсор')
+    return values
+
+
+def parse_history_date(value, is_end=False):
+    value = str(value) if value else ''
+    if not value:
+        return None
+
+    if len(value) == 4 and value.isdigit():
+        return date(int(value), 12, 31) if is_end else date(int(value), 1, 1)
+
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def get_history_dates(date_range):
+    """Возвращает (начало, конец, только_год) для индексируемых колонок поста.
+
+    Конец никогда не пустой при заданном начале: для одного года это 31 декабря,
+    для точной даты — сама дата, чтобы фильтр по пересечению был одним условием.
+    """
+    try:
+        date_data = json.loads(date_range) if date_range else {}
+    except ValueError:
+        date_data = {}
+
+    start_value = date_data.get('start_date')
+    end_value = date_data.get('end_date')
 
+    history_start = parse_history_date(start_value)
+    if not history_start:
+        return None, None, False
 
+    year_only = len(str(start_value)) == 4 and (not end_value or len(str(end_value)) == 4)
+    history_end = parse_history_date(end_value, is_end=True)
+    if not history_end:
+        history_end = date(history_start.year, 12, 31) if year_only else history_start
 
+    return history_start, history_end, year_only
@@ -0,0 +1,142 @@
+import hashlib
+import os
+import posixpath
+import re
+import uuid
+
+from flask import send_from_directory
+from werkzeug.security import safe_join
+
+from ..config import Config
+
+_ASSET_ID_RE = re.compile(r'^(?P<key>[0-9a-f]{64})\.(?P<extension>[a-z0-9]+)$')
+
+
+class LocalAssetStorage:
+    """Контентно-адресуемое хранилище файлов на локальном диске.
+
+    Файл называется по sha256 исходных байтов и раскладывается по двухуровневым
+    шардам: objects/ab/cd/abcd....png. Одинаковые загрузки получают один и тот же путь,
+    поэтому повторно не обрабатываются и не занимают места, а имя не нужно подбирать
+    сканированием папки. Запись атомарна: во временный файл, затем os.replace.
+
+    Пути, которые хранятся в базе и отдаются клиентам, начинаются с public_prefix
+    (как и у файлов, загруженных до появления хранилища).
+
+    Исходники, загруженные через /post/upload, адресуются asset id вида <sha256>.<расширение>
+    и лежат в upload_root вне публичного каталога: в них остаются EXIF/GPS и исходный размер,
+    поэтому наружу отдаются только обработанные версии из objects/ под тем же ключом.
+    """
+
+    def __init__(self, root, upload_root, public_prefix='src/assets/'):
+        self.root = root
+        self.upload_root = upload_root
+        self.public_prefix = public_prefix
+
+    @staticmethod
+    def content_key(data):
+        return hashlib.sha256(data).hexdigest()
+
+    def path_for(self, key, extension):
+        return f'{self.public_prefix}objects/{key[:2]}/{key[2:4]}/{key}.{extension}'
+
+    def upload_path(self, key, extension):
+        """Путь на диске к исходнику загрузки; публичного адреса у исходников нет."""
+        return os.path.join(self.upload_root, key[:2], key[2:4], f'{key}.{extension}')
+
+    @staticmethod
+    def parse_asset_id(asset_id):
+        match = _ASSET_ID_RE.match(asset_id or '')
+        if not match:
+            raise ValueError(f'Некорректный идентификатор файла: {asset_id}')
+        return match.group('key'), match.group('extension')
+
+    def relative_path(self, path):
+        return path[len(self.public_prefix):] if path.startswith(self.public_prefix) else path
+
+    def is_content_addressed(self, path):
+        """Файлы в objects/ никогда не меняются по тому же пути."""
+        return self.relative_path(path).startswith('objects/')
+
+    def is_private(self, path):
+        # uploads/ внутри публичного каталога — исходники, сохранённые до переноса в upload_root.
+        return posixpath.normpath(self.relative_path(path)).lstrip('/').split('/')[0] == 'uploads'
+
+    def is_stored_path(self, path):
+        """Является ли строка публичным путём существующего файла хранилища."""
+        return isinstance(path, str) and path.startswith(self.public_prefix) and self.exists(path)
+
+    def local_path(self, path):
+        """Путь на диске для публичного пути; None, если путь выходит за пределы хранилища."""
+        return safe_join(self.root, self.relative_path(path))
+
+    def exists(self, path):
+        return self._is_complete_file(self.local_path(path))
+
+    def upload_exists(self, key, extension):
+        return self._is_complete_file(self.upload_path(key, extension))
+
+    @staticmethod
+    def _is_complete_file(local_path):
+        # Пустой файл — незавершённая запись или заглушка старого формата.
+        return bool(local_path) and os.path.isfile(local_path) and os.path.getsize(local_path) > 0
+
+    def save(self, path, data):
+        """Атомарно записывает байты по пути; существующий файл с тем же ключом не трогает."""
+        if self.exists(path):
+            return path
+
+        local_path = self.local_path(path)
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        temp_path = f'{local_path}.{uuid.uuid4().hex}.tmp'
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, local_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return path
+
+    def save_stream(self, stream, extension, max_size=None, chunk_size=64 * 1024):
+        """Потоково пишет загрузку в upload_root, считая хэш по ходу. Возвращает asset id.
+
+        В памяти одновременно находится не больше chunk_size байт; при превышении
+        max_size временный файл удаляется и выбрасывается ValueError.
+        """
+        temp_folder = os.path.join(self.upload_root, 'tmp')
+        os.makedirs(temp_folder, exist_ok=True)
+        temp_path = os.path.join(temp_folder, uuid.uuid4().hex)
+
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with open(temp_path, 'wb') as f:
+                while True:
+                    chunk = stream.read(chunk_size)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if max_size and size > max_size:
+                        raise ValueError('Файл слишком большой')
+                    digest.update(chunk)
+                    f.write(chunk)
+
+            if not size:
+                raise ValueError('Пустой файл')
+
+            key = digest.hexdigest()
+            if not self.upload_exists(key, extension):
+                upload_path = self.upload_path(key, extension)
+                os.makedirs(os.path.dirname(upload_path), exist_ok=True)
+                os.replace(temp_path, upload_path)
+            return f'{key}.{extension}'
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def send(self, path, **kwargs):
+        return send_from_directory(self.root, self.relative_path(path), **kwargs)
+
+
+asset_storage = LocalAssetStorage(Config.UPLOAD_FOLDER, Config.UPLOAD_SOURCE_FOLDER)
@@ -0,0 +1,102 @@
+import base64
+
+import cv2
+import numpy as np
+import pytest
+
+from src.config import Config
+
+Config.SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+Config.IMAGE_WORKERS = 0
+Config.VIEW_FLUSH_INTERVAL = 0
+
+from src import create_app
+from src.db import db
+from src.grpc_server.local_user_server import run_local_user_server
+from src.proto import tag_pb2
+from src.services import post_service, search_index
+from src.services.suggest_index import SuggestionIndex
+from src.utils.storage import asset_storage
+
+USERS = [
+    {'id': 1, 'email': 'poster@example.com', 'name': 'Анна', 'surname': 'Иванова', 'role': 'poster'},
+    {'id': 2, 'email': 'user@example.com', 'name': 'Борис', 'surname': 'Петров', 'role': 'user'},
+]
+
+
+class FakeTagStub:
+    """Замена tag-api: тег с id N называется tagN, если в names не задано другое (None — тег удалён)."""
+
+    def __init__(self):
+        self.calls = []
+        self.names = {}
+
+    def GetTagsByIds(self, request):
+        self.calls.append(list(request.tag_ids))
+        return tag_pb2.GetTagsByIdsResponse(tags=[
+            tag_pb2.GetTagByIdResponse(id=str(tag_id), name=self.names.get(tag_id, f'tag{tag_id}'))
+            for tag_id in request.tag_ids if self.names.get(tag_id, True) is not None
+        ])
+
+
+@pytest.fixture(scope='session')
+def user_server():
+    server = run_local_user_server(USERS)
+    yield server
+    server.stop(0)
+
+
+@pytest.fixture
+def tag_stub(monkeypatch):
+    stub = FakeTagStub()
+    monkeypatch.setattr(post_service, 'tag_stub', stub)
+    return stub
+
+
+@pytest.fixture
+def app(user_server, tag_stub, tmp_path, monkeypatch):
+    monkeypatch.setattr(asset_storage, 'root', str(tmp_path / 'assets'))
+    monkeypatch.setattr(asset_storage, 'upload_root', str(tmp_path / 'uploads'))
+    # Индекс без app: фоновая пересборка не запускается, тесты вызывают rebuild() сами.
+    monkeypatch.setattr(post_service, 'suggestion_index', SuggestionIndex())
+    # Новая база в памяти на каждый тест: таблицу полнотекстового поиска нужно создать заново.
+    search_index._indexes.clear()
+    for cache in (post_service.user_cache, post_service.tag_cache, post_service.post_cache):
+        cache.clear()
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def image_bytes():
+    img = np.zeros((48, 64, 3), np.uint8)
+    img[:, :32] = (0, 0, 255)
+    ok, buffer = cv2.imencode('.png', img)
+    return buffer.tobytes()
+
+
+@pytest.fixture
+def image_data_url(image_bytes):
+    return 'data:image/png;base64,' + base64.b64encode(image_bytes).decode()
+
+
+@pytest.fixture
+def create_post(app, image_data_url):
+    def create(header='Пост', content=None, tags=(1,), author='poster@example.com', **fields):
+        data = {
+            'header': header,
+            'main_image': image_data_url,
+            'lead': 'Лид',
+            'reviewer': 'Рецензент',
+            'content': content if content is not None else [{'type': 'text', 'value': 'Текст'}],
+            'tags': list(tags),
+            **fields
+        }
+        return post_service.create_post_service(data, author)
+
+    return create
@@ -0,0 +1,35 @@
+import io
+import os
+
+from src.services import post_service
+from src.utils.storage import asset_storage
+
+
+def test_uploaded_original_is_not_public(app, create_post, image_bytes):
+    [asset_id] = post_service.upload_images_service(
+        [(io.BytesIO(image_bytes), 'image/png', 'photo.png')], 'poster@example.com'
+    )
+    post = create_post(main_image=asset_id)
+    key, extension = asset_storage.parse_asset_id(asset_id)
+
+    upload_path = asset_storage.upload_path(key, extension)
+    assert os.path.isfile(upload_path)
+    assert not upload_path.startswith(asset_storage.root + os.sep)
+
+    client = app.test_client()
+    processed = client.get(f'/api/file/{asset_storage.relative_path(post.main_image)}')
+    assert processed.status_code == 200
+    assert 'immutable' in processed.headers['Cache-Control']
+
+    original = f'uploads/{key[:2]}/{key[2:4]}/{asset_id}'
+    for path in (original, f'./{original}', f'objects/../{original}'):
+        assert client.get(f'/api/file/{path}').status_code == 404
+
+
+def test_legacy_uploads_inside_asset_root_are_not_served(app, image_bytes):
+    legacy = os.path.join(asset_storage.root, 'uploads', 'ab', 'cd', 'legacy.png')
+    os.makedirs(os.path.dirname(legacy))
+    with open(legacy, 'wb') as f:
+        f.write(image_bytes)
+
+    assert app.test_client().get('/api/file/uploads/ab/cd/legacy.png').status_code == 404
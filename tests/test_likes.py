@@ -0,0 +1,75 @@
+import pytest
+
+from src.models import Post, UserActions
+from src.services import post_service
+from src.services.view_recorder import view_recorder
+
+FINGER_PRINT = 'fp-1'
+
+
+def _actions(post_id):
+    return [
+        (action.finger_print, action.is_liked)
+        for action in UserActions.query.filter_by(post_id=post_id)
+    ]
+
+
+def _counters(address):
+    post = Post.query.filter_by(address=address).one()
+    return post.likes_count, post.views_count
+
+
+def test_like_without_view_creates_row_and_counts_view(app, create_post):
+    post = create_post()
+
+    result = post_service.add_like_to_post_service(post.address, FINGER_PRINT)
+
+    assert result == {'is_liked': True, 'likes': 1, 'views': 1}
+    assert _actions(post.id) == [(FINGER_PRINT, True)]
+    assert _counters(post.address) == (1, 1)
+
+
+def test_second_like_toggles_back(app, create_post):
+    post = create_post()
+    post_service.add_like_to_post_service(post.address, FINGER_PRINT)
+
+    result = post_service.add_like_to_post_service(post.address, FINGER_PRINT)
+
+    assert result == {'is_liked': False, 'likes': 0, 'views': 1}
+    assert _actions(post.id) == [(FINGER_PRINT, False)]
+    assert _counters(post.address) == (0, 1)
+
+
+def test_like_while_view_is_pending_counts_view_once(app, create_post, monkeypatch):
+    monkeypatch.setattr(view_recorder, 'flush_interval', 3600)
+    monkeypatch.setattr(view_recorder, '_ensure_worker', lambda: None)
+    post = create_post()
+
+    viewed = post_service.get_post_by_address_service(post.address, FINGER_PRINT)
+    assert viewed['views'] == 0
+    assert view_recorder.is_pending(FINGER_PRINT, post.id)
+
+    result = post_service.add_like_to_post_service(post.address, FINGER_PRINT)
+    view_recorder.flush()
+
+    assert result == {'is_liked': True, 'likes': 1, 'views': 1}
+    assert not view_recorder.is_pending(FINGER_PRINT, post.id)
+    assert _actions(post.id) == [(FINGER_PRINT, True)]
+    assert _counters(post.address) == (1, 1)
+
+
+def test_returned_counters_match_other_visitors(app, create_post):
+    post = create_post()
+    post_service.get_post_by_address_service(post.address, 'fp-viewer')
+    post_service.add_like_to_post_service(post.address, 'fp-liker')
+
+    result = post_service.add_like_to_post_service(post.address, FINGER_PRINT)
+
+    assert result == {'is_liked': True, 'likes': 2, 'views': 3}
+    viewed = post_service.get_post_by_address_service(post.address, FINGER_PRINT)
+    assert (viewed['is_liked'], viewed['likes'], viewed['views']) == (True, 2, 3)
+
+
+def test_like_unknown_post(app):
+    with pytest.raises(ValueError, match='Пост не найден'):
+        post_service.add_like_to_post_service('missing', FINGER_PRINT)
@@ -0,0 +1,63 @@
+import grpc
+
+from src.grpc_server.local_user_server import LocalUserService
+from src.services import post_service
+
+from conftest import USERS
+
+
+class UnimplementedBatchError(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.UNIMPLEMENTED
+
+
+class LegacyUserStub:
+    """user-api без GetUsersByIds."""
+
+    def __init__(self):
+        self.service = LocalUserService(USERS)
+        self.single_calls = []
+
+    def GetUsersByIds(self, request):
+        raise UnimplementedBatchError()
+
+    def GetUserById(self, request):
+        self.single_calls.append(request.user_id)
+        return self.service.GetUserById(request, None)
+
+
+def test_users_fall_back_to_single_lookups_when_batch_is_unimplemented(app, monkeypatch):
+    stub = LegacyUserStub()
+    monkeypatch.setattr(post_service, 'user_stub', stub)
+
+    users = post_service.get_users_by_ids([2, 1, 2])
+
+    assert {user_id: user['name'] for user_id, user in users.items()} == {1: 'Анна', 2: 'Борис'}
+    assert stub.single_calls == [1, 2]
+    assert post_service.get_users_by_ids([1, 2]) == users
+    assert stub.single_calls == [1, 2]
+
+
+def test_new_post_takes_tag_names_from_tag_api_not_worker_cache(app, create_post, tag_stub):
+    # Кэш воркера не знает о переименовании и удалении, которые пришли в gRPC-процесс.
+    post_service.tag_cache.set(1, {'id': '1', 'name': 'Старое имя'})
+    post_service.tag_cache.set(2, {'id': '2', 'name': 'Удалённый'})
+    tag_stub.names = {1: 'Новое имя', 2: None}
+
+    post = create_post(tags=(1, 2))
+
+    result = post_service.get_post_by_address_service(post.address)
+    assert result['tags'] == [{'tag_id': 1, 'tag_name': 'Новое имя'}]
+
+
+
+def test_revoked_role_applies_without_waiting_for_user_cache(app, create_post, monkeypatch):
+    address = create_post().address
+    assert post_service.user_cache.lookup(('email', 'poster@example.com'))[0]
+
+    # Роль отозвана в user-api, а InvalidateUser до этого процесса не дошёл.
+    monkeypatch.setitem(USERS[0], 'role', 'user')
+
+    error, status = post_service.approve_post_service(address, 'poster@example.com')
+    assert status == 403
+    assert create_post(header='Черновик').is_approved is False
@@ -0,0 +1,85 @@
+import pytest
+
+from src.services import post_service
+from src.utils.post_utils import encode_cursor
+
+YEARS = [1700, 1240, 1918, 1380, 1812, 1550, 1941]
+
+
+@pytest.fixture
+def posts(create_post):
+    return [
+        create_post(header=f'Крепость {year}', left_date=str(year), right_date=str(year))
+        for year in YEARS
+    ]
+
+
+def _walk(fetch, limit=3):
+    headers, cursor, pages = [], None, 0
+    while True:
+        page = fetch(cursor, limit)
+        headers.extend(post['header'] for post in page['posts'])
+        pages += 1
+        cursor = page['next_cursor']
+        if cursor is None:
+            return headers, pages
+
+
+def test_creation_order_walks_to_the_end(app, posts):
+    headers, pages = _walk(lambda cursor, limit: post_service.get_all_posts_service(
+        date_filter_type='creation', cursor=cursor, limit=limit))
+
+    assert headers == [f'Крепость {year}' for year in reversed(YEARS)]
+    assert pages == 3
+
+
+def test_historical_order_walks_to_the_end(app, posts):
+    headers, pages = _walk(lambda cursor, limit: post_service.get_all_posts_service(
+        date_filter_type='historical', cursor=cursor, limit=limit))
+
+    assert headers == [f'Крепость {year}' for year in sorted(YEARS)]
+    assert pages == 3
+
+
+def test_search_walks_to_the_end(app, posts, create_post):
+    create_post(header='Собор')
+
+    headers, pages = _walk(lambda cursor, limit: post_service.search_posts_service(
+        'крепость', cursor=cursor, limit=limit))
+
+    assert sorted(headers) == sorted(f'Крепость {year}' for year in YEARS)
+    assert pages == 3
+
+
+def _cursor(client, url, data):
+    return client.post(url, json=data).get_json()['next_cursor']
+
+
+@pytest.mark.parametrize('url, data, foreign', [
+    ('/api/post/get_all_posts', {'dateFilterType': 'creation'}, {'dateFilterType': 'historical'}),
+    ('/api/post/get_all_posts', {'dateFilterType': 'historical'}, {'dateFilterType': 'creation'}),
+    ('/api/post/get_all_posts', {'dateFilterType': 'creation'}, {'query': 'крепость'}),
+    ('/api/post/search', {'query': 'крепость'}, {'dateFilterType': 'creation'}),
+])
+def test_cursor_from_other_ordering_is_rejected(app, posts, url, data, foreign):
+    client = app.test_client()
+    foreign_url = '/api/post/search' if 'query' in foreign else '/api/post/get_all_posts'
+    cursor = _cursor(client, foreign_url, {**foreign, 'limit': 2})
+    assert cursor
+
+    response = client.post(url, json={**data, 'cursor': cursor, 'limit': 2})
+
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Некорректный курсор'}
+
+
+@pytest.mark.parametrize('cursor', ['не курсор', encode_cursor('x'), encode_cursor(None, 1), encode_cursor('2024-01-01', 'x')])
+@pytest.mark.parametrize('url, data', [
+    ('/api/post/get_all_posts', {'dateFilterType': 'creation'}),
+    ('/api/post/search', {'query': 'крепость'}),
+])
+def test_malformed_cursor_is_rejected(app, posts, url, data, cursor):
+    response = app.test_client().post(url, json={**data, 'cursor': cursor})
+
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Некорректный курсор'}
@@ -0,0 +1,35 @@
+import pytest
+
+from src.models import ImageInPost, Post
+from src.services import post_service
+
+
+@pytest.mark.parametrize('main_image', [None, ''])
+def test_post_without_main_image_is_created(app, create_post, main_image):
+    post = create_post(main_image=main_image, content=[
+        {'type': 'text', 'value': 'Текст'},
+        {'type': 'image', 'src': main_image, 'description': 'Без файла'}
+    ])
+
+    assert post.main_image is None
+    assert post.processing_status == 'ready'
+    assert [image.address for image in ImageInPost.query.filter_by(post_id=post.id)] == [None]
+
+    result = post_service.get_post_by_address_service(post.address)
+    assert result['main_image'] is None
+    assert result['images'] == [{'address': None, 'description': 'Без файла'}]
+
+
+def test_edit_can_clear_main_image(app, create_post):
+    address = create_post().address
+    post = post_service.get_post_by_address_service(address)
+
+    post_service.edit_post_service(address, {
+        'header': post['header'],
+        'main_image': '',
+        'date_range': {'start_date': None, 'end_date': None},
+        'content': [{'type': 'text', 'value': 'Текст'}],
+        'tags': [1]
+    }, 'poster@example.com')
+
+    assert Post.query.filter_by(address=address).one().main_image is None
@@ -0,0 +1,37 @@
+from src.models import Post, TagInPost
+from src.services import post_service
+
+
+def _edit(address, post, **changes):
+    data = {
+        'header': post['header'],
+        'date_range': {'start_date': None, 'end_date': None},
+        'content': [{'type': 'text', 'value': text['text']} for text in post['text']],
+        'tags': [tag['tag_id'] for tag in post['tags']],
+        **changes
+    }
+    return post_service.edit_post_service(address, data, 'poster@example.com')
+
+
+def test_tag_only_edit_bumps_version_and_refreshes_cached_post(app, create_post):
+    address = create_post(tags=(1,)).address
+    before = post_service.get_post_by_address_service(address)
+    version = Post.query.filter_by(address=address).one().version
+
+    _edit(address, before, tags=[1, 2])
+
+    post = Post.query.filter_by(address=address).one()
+    assert post.version == version + 1
+    assert sorted(tag.tag_id for tag in TagInPost.query.filter_by(post_id=post.id)) == [1, 2]
+    after = post_service.get_post_by_address_service(address)
+    assert [tag['tag_name'] for tag in after['tags']] == ['tag1', 'tag2']
+
+
+def test_noop_edit_keeps_version(app, create_post):
+    address = create_post(tags=(1, 2)).address
+    before = post_service.get_post_by_address_service(address)
+    version = Post.query.filter_by(address=address).one().version
+
+    _edit(address, before)
+
+    assert Post.query.filter_by(address=address).one().version == version
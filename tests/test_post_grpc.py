@@ -0,0 +1,27 @@
+import asyncio
+from concurrent import futures
+
+from src.db import db
+from src.grpc_server.post_server import gRPCPostService
+from src.proto import post_pb2
+
+
+def _get_posts_by_ids(app, post_ids, **fields):
+    async def call():
+        with futures.ThreadPoolExecutor(max_workers=1) as executor:
+            service = gRPCPostService(app, executor)
+            request = post_pb2.GetPostsByIdsRequest(post_ids=post_ids, **fields)
+            return await service.GetPostsByIds(request, context=None)
+
+    return [post.header for post in asyncio.run(call()).posts]
+
+
+def test_get_posts_by_ids_skips_drafts_unless_asked(app, create_post):
+    approved = create_post(header='Одобренный')
+    draft = create_post(header='Черновик')
+    draft.is_approved = False
+    db.session.commit()
+    post_ids = [draft.id, approved.id]
+
+    assert _get_posts_by_ids(app, post_ids) == ['Одобренный']
+    assert _get_posts_by_ids(app, post_ids, include_unapproved=True) == ['Черновик', 'Одобренный']
@@ -0,0 +1,94 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from src.db import db
+from src.services import post_service
+
+
+@contextmanager
+def count_statements():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def _content(blocks):
+    content = []
+    for i in range(blocks):
+        content.append({'type': 'text', 'value': f'Абзац {i}'})
+        content.append({'type': 'video', 'src': f'https://example.com/video/{i}'})
+    return content
+
+
+def _create_posts(create_post, count):
+    return [
+        create_post(header=f'Крепость {i}', content=_content(3), tags=(1, 2, 3))
+        for i in range(count)
+    ]
+
+
+def _statements_for(app, create_post, count, call):
+    _create_posts(create_post, count)
+    post_service.post_cache.clear()
+    with count_statements() as statements:
+        call()
+    return len(statements)
+
+
+@pytest.mark.parametrize('date_filter_type', ['creation', 'historical'])
+def test_get_all_posts_query_count_does_not_depend_on_page_size(app, create_post, date_filter_type):
+    def list_posts():
+        result = post_service.get_all_posts_service(date_filter_type=date_filter_type, limit=50)
+        assert all(post['tags'] for post in result['posts'])
+        return result
+
+    few = _statements_for(app, create_post, 3, list_posts)
+    many = _statements_for(app, create_post, 30, list_posts)
+
+    assert few == many
+
+
+def test_search_posts_query_count_does_not_depend_on_hits(app, create_post):
+    def search():
+        result = post_service.search_posts_service('крепость', limit=50)
+        assert result['posts']
+        return result
+
+    few = _statements_for(app, create_post, 3, search)
+    many = _statements_for(app, create_post, 30, search)
+
+    assert few == many
+
+
+def test_get_post_query_count_does_not_depend_on_content_size(app, create_post):
+    small = create_post(header='Маленький', content=_content(1), tags=(1,)).address
+    large = create_post(header='Большой', content=_content(30), tags=range(1, 11)).address
+
+    counts = []
+    for address in (small, large):
+        post_service.post_cache.clear()
+        with count_statements() as statements:
+            result = post_service.get_post_by_address_service(address)
+        assert result['text']
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1]
+
+
+def test_cached_get_post_reads_only_counters(app, create_post):
+    address = create_post(content=_content(5)).address
+    post_service.get_post_by_address_service(address)
+
+    with count_statements() as statements:
+        post_service.get_post_by_address_service(address)
+
+    assert len(statements) == 1
@@ -0,0 +1,23 @@
+from src.db import db
+from src.services import post_service
+from src.services.search_index import get_search_index
+
+
+def _search(query):
+    return [post['header'] for post in post_service.search_posts_service(query)['posts']]
+
+
+def test_reindex_missing_only_indexes_posts_without_documents(app, create_post):
+    indexed = create_post(header='Крепость Орешек')
+    missing = create_post(header='Крепость Копорье')
+    get_search_index().remove_post(missing.id)
+    db.session.commit()
+    assert _search('Копорье') == []
+
+    result = app.test_cli_runner().invoke(args=['posts', 'reindex-search', '--missing-only'])
+
+    assert result.exit_code == 0, result.output
+    assert '1 постов' in result.output
+    assert _search('Копорье') == ['Крепость Копорье']
+    assert _search('Орешек') == ['Крепость Орешек']
+    assert post_service.reindex_search_service(missing_only=True) == 0
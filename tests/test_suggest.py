@@ -0,0 +1,36 @@
+import time
+
+from src.db import db
+from src.services import post_service
+from src.services.suggest_index import SuggestionIndex
+from test_post_queries import count_statements
+
+
+def _approve(post):
+    post.is_approved = True
+    db.session.commit()
+
+
+def test_stale_index_answers_from_memory(app, create_post):
+    _approve(create_post(header='Крепость Орешек'))
+    index = post_service.suggestion_index
+    index.ttl = 0
+    index.rebuild()
+
+    with count_statements() as statements:
+        assert index.suggest('креп') == ['Крепость Орешек']
+        assert index.suggest('орешек') == ['Крепость Орешек']
+
+    assert statements == []
+
+
+def test_background_worker_builds_index(app, create_post):
+    _approve(create_post(header='Крепость Орешек'))
+    index = SuggestionIndex(ttl=60, app=app)
+
+    assert index.suggest('креп') == []
+    deadline = time.monotonic() + 5
+    while index.stats()['age'] is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert index.suggest('креп') == ['Крепость Орешек']